@@ -4,11 +4,11 @@ This module processes notifications from Jira and publishes events to EventBridg
 """
 
 import json
-import html
 import os
 import datetime
 import traceback
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 
 from boto3 import client, resource
@@ -44,6 +44,9 @@ else:
 events_client = client("events")
 dynamodb = resource("dynamodb")
 
+# Thread pool for overlapping the independent Jira and DynamoDB lookups
+executor = ThreadPoolExecutor(max_workers=2)
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder for datetime objects"""
@@ -272,8 +275,8 @@ class DatabaseService:
             )
             items = response["Items"]
 
-            # Handle pagination if there are more items
-            while "LastEvaluatedKey" in response:
+            # Only the first match is used, so keep paging only until a page yields matches
+            while not items and "LastEvaluatedKey" in response:
                 response = self.table.scan(
                     FilterExpression=Attr("jiraIssueId").eq(jira_issue_id),
                     ExclusiveStartKey=response["LastEvaluatedKey"],
@@ -497,9 +500,9 @@ class SNSMessageProcessorService:
             return False
 
         try:
-            # Log the automation data (sanitized)
-            logger.info(
-                f"Processing automation data: {html.escape(json.dumps(automation_data))}"
+            # Log only the issue ID rather than serializing the whole payload
+            logger.debug(
+                "Processing automation data for issue %s", automation_data.get("IssueId")
             )
 
             # Create an EventPublisherService instance
@@ -511,17 +514,21 @@ class SNSMessageProcessorService:
                 logger.error("No IssueId found in automation data")
                 return False
 
-            # Get Jira issue details from Jira first
-            jira_issue_details = self.jira_service.get_issue_details(jira_issue_id)
+            # Get Jira issue details from Jira and from the database concurrently
+            jira_future = executor.submit(
+                self.jira_service.get_issue_details, jira_issue_id
+            )
+            ddb_future = executor.submit(
+                self.db_service.get_issue_details, jira_issue_id
+            )
+            jira_issue_details = jira_future.result()
+            jira_issue_details_ddb = ddb_future.result()
             if not jira_issue_details:
                 logger.error(
                     f"Failed to get issue details for {jira_issue_id} from Jira"
                 )
                 return False
 
-            # Get Jira issue details from database
-            jira_issue_details_ddb = self.db_service.get_issue_details(jira_issue_id)
-
             # If issue not found in database, publish created event and update the database
             if not jira_issue_details_ddb:
                 logger.info(
@@ -596,7 +603,7 @@ def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
     """
     try:
         # Log incoming event
-        logger.info(f"Received event: {json.dumps(event)}")
+        logger.info("Received event: %s", event)
 
         # Validate event structure
         if not isinstance(event, dict):
@@ -1,4 +1,7 @@
+import hmac
 import json
+import time
+from typing import Dict, Optional, Tuple
 import boto3
 import os
 import logging
@@ -17,6 +20,61 @@ else:
 
 secrets_client = boto3.client("secretsmanager")
 
+# Longest bearer token worth checking; generated tokens are 32 characters
+MAX_TOKEN_LENGTH = 256
+
+# Encoded expected tokens cached across warm invocations, keyed by secret ARN
+SECRET_CACHE_TTL = int(os.environ.get("SECRET_CACHE_TTL", "300"))
+token_cache: Dict[str, Tuple[float, Optional[bytes]]] = {}
+
+# Minimum age of a cached token before a mismatching request may refetch it, so
+# invalid tokens cannot drive a Secrets Manager call on every request
+SECRET_REFETCH_INTERVAL = int(os.environ.get("SECRET_REFETCH_INTERVAL", "10"))
+
+
+def get_expected_token(
+    secret_arn: str, max_age: Optional[float] = None
+) -> Tuple[Optional[bytes], bool]:
+    """Get the expected API auth token, reusing it for SECRET_CACHE_TTL seconds.
+
+    After a rotation the previous token stays accepted by a warm instance until its
+    cached copy expires, i.e. for up to SECRET_CACHE_TTL seconds, unless a request
+    with the new token forces an earlier refetch.
+
+    Args:
+        secret_arn (str): The ARN of the API auth secret
+        max_age (Optional[float]): Oldest cached copy to reuse, in seconds; defaults
+            to SECRET_CACHE_TTL
+
+    Returns:
+        Tuple[Optional[bytes], bool]: Encoded token (None if the secret has none) and
+        whether it came from the cache
+    """
+    if max_age is None:
+        max_age = SECRET_CACHE_TTL
+    cached = token_cache.get(secret_arn)
+    if cached and time.monotonic() - cached[0] < max_age:
+        return cached[1], True
+
+    response = secrets_client.get_secret_value(SecretId=secret_arn)
+    expected_token = json.loads(response["SecretString"]).get("token")
+    value = expected_token.encode() if expected_token else None
+    token_cache[secret_arn] = (time.monotonic(), value)
+    return value, False
+
+
+def is_valid_token(token: bytes, expected_token: Optional[bytes]) -> bool:
+    """Compare a request token to the expected token in constant time.
+
+    Args:
+        token (bytes): Token from the request
+        expected_token (Optional[bytes]): Expected token, None if not configured
+
+    Returns:
+        bool: True if the tokens match
+    """
+    return bool(expected_token) and hmac.compare_digest(token, expected_token)
+
 
 def handler(event, context):
     """
@@ -42,19 +100,27 @@ def handler(event, context):
 
         # Get expected token from Secrets Manager
         api_auth_secret_arn = os.environ.get("API_AUTH_SECRET")
-        if not api_auth_secret_arn:
+        if not token or len(token) > MAX_TOKEN_LENGTH:
+            # Reject empty or oversized tokens without reading the secret
+            logger.info("Missing or malformed authorization token")
+            effect = "Deny"
+        elif not api_auth_secret_arn:
             logger.error("API_AUTH_SECRET environment variable not set")
             effect = "Deny"
         else:
             try:
-                response = secrets_client.get_secret_value(SecretId=api_auth_secret_arn)
-                secret_dict = json.loads(response["SecretString"])
-                expected_token = secret_dict.get("token")
-                # Validate token
-                if token == expected_token:
-                    effect = "Allow"
-                else:
-                    effect = "Deny"
+                token_bytes = token.encode()
+                expected_token, from_cache = get_expected_token(api_auth_secret_arn)
+                valid = is_valid_token(token_bytes, expected_token)
+                if not valid and from_cache:
+                    # The token may have been rotated since it was cached; refetch
+                    # unless the cached copy is younger than SECRET_REFETCH_INTERVAL
+                    expected_token, from_cache = get_expected_token(
+                        api_auth_secret_arn, max_age=SECRET_REFETCH_INTERVAL
+                    )
+                    if not from_cache:
+                        valid = is_valid_token(token_bytes, expected_token)
+                effect = "Allow" if valid else "Deny"
             except Exception as e:
                 logger.error(f"Failed to retrieve secret: {str(e)}")
                 effect = "Deny"
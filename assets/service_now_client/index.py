@@ -31,25 +31,12 @@ except ImportError:
         convert_unmapped_fields_to_string_for_snow_comments,
     )
 
-# Configure logging
+# Configure logging; the level comes from the LOG_LEVEL environment variable and defaults to ERROR
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)  # Set to INFO first
-
-# Debug: Print all environment variables
-print(f"All environment variables: {dict(os.environ)}")
-
-# Get log level from environment variable
 log_level = os.environ.get("LOG_LEVEL", "error").lower()
-print(f"LOG_LEVEL environment variable: {log_level}")  # Debug print
-if log_level == "debug":
-    logger.setLevel(logging.DEBUG)
-elif log_level == "info":
-    logger.setLevel(logging.INFO)
-else:
-    # Default to ERROR level
-    logger.setLevel(logging.ERROR)
-
-print(f"Logger level set to: {logger.level}")  # Debug print
+logger.setLevel(
+    {"debug": logging.DEBUG, "info": logging.INFO}.get(log_level, logging.ERROR)
+)
 
 # Initialize AWS clients
 security_incident_response_client = boto3.client("security-ir")
@@ -3,16 +3,22 @@ ServiceNow Notifications Handler Lambda function for AWS Security Incident Respo
 This module processes notifications from ServiceNow and publishes events to EventBridge.
 """
 
-import json
+import functools
+import hashlib
+import logging
 import os
-import datetime
+import random
 import time
-import traceback
-import logging
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple, Union
+from urllib.parse import parse_qsl
 import boto3
-from boto3.dynamodb.conditions import Attr
+import orjson
+from cachetools import TTLCache
+from boto3.dynamodb.conditions import Key
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from aws_lambda_powertools import Logger
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
 try:
@@ -24,49 +30,148 @@ except ImportError:
 
 # Constants
 EVENT_SOURCE = os.environ.get("EVENT_SOURCE", "service-now")
+INTEGRATION_MODULE = os.environ.get("INTEGRATION_MODULE", "itsm")
+
+# Initialize logger
+logger = Logger(
+    service="service-now-notifications",
+    level=os.environ.get("LOG_LEVEL", "error").upper(),
+)
+
+# The ServiceNow wrapper logs incident details through the root logger and sets it to
+# INFO on import, so hold the root logger to LOG_LEVEL as well
+logging.getLogger().setLevel(logger.log_level)
+
+# Response headers and CORS preflight headers; responses get their own copies so
+# nothing downstream can modify these between requests
+CORS_HEADERS = {
+    "Content-Type": "application/json",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "Content-Type",
+    "Access-Control-Allow-Methods": "POST,OPTIONS",
+}
+OPTIONS_HEADERS = {
+    **CORS_HEADERS,
+    "Access-Control-Allow-Headers": "Content-Type,Authorization",
+}
+
+# Webhook payload fields that may carry the incident number, in order of preference
+INCIDENT_NUMBER_FIELDS = (
+    "incident_number",
+    "number",
+    "sys_id",
+    "id",
+    "incident_id",
+    "incidentNumber",
+)
+
+# DynamoDB global secondary index keyed by serviceNowIncidentId
+SERVICE_NOW_INCIDENT_ID_INDEX = "serviceNowIncidentId-index"
+
+# Backoff bounds for retrying incident lookups that race with the ServiceNow client
+LOOKUP_BASE_WAIT_SECONDS = 0.5
+LOOKUP_MAX_WAIT_SECONDS = 4
+
+# EventBridge accepts at most 10 entries per PutEvents call
+PUT_EVENTS_MAX_ENTRIES = 10
+PUT_EVENTS_MAX_ATTEMPTS = 3
+PUT_EVENTS_BASE_WAIT_SECONDS = 0.1
+
+# Shared client configuration: adaptive retry mode (backoff plus client-side rate
+# limiting when throttled), TCP keepalive so warm invocations reuse connections,
+# and tight timeouts instead of the 60s defaults
+BOTO3_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=5,
+    max_pool_connections=10,
+)
 
-# Configure logging
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)  # Set to INFO first
+# Initialize AWS clients
+events_client = boto3.client("events", config=BOTO3_CONFIG)
+ssm_client = boto3.client("ssm", config=BOTO3_CONFIG)
 
-# Get log level from environment variable
-log_level = os.environ.get("LOG_LEVEL", "error").lower()
-print(f"LOG_LEVEL environment variable: {log_level}")  # Debug print
-if log_level == "debug":
-    logger.setLevel(logging.DEBUG)
-elif log_level == "info":
-    logger.setLevel(logging.INFO)
-else:
-    # Default to ERROR level
-    logger.setLevel(logging.ERROR)
+# SSM parameter values reused across warm invocations; parameters rarely change
+SSM_CACHE_TTL = int(os.environ.get("SSM_CACHE_TTL", "300"))
+parameter_cache = TTLCache(maxsize=32, ttl=SSM_CACHE_TTL)
+dynamodb = boto3.resource("dynamodb", config=BOTO3_CONFIG)
 
-print(f"Logger level set to: {logger.level}")  # Debug print
+# Thread pool for overlapping independent ServiceNow requests
+executor = ThreadPoolExecutor(max_workers=2)
 
-# Initialize AWS clients
-events_client = boto3.client("events")
-dynamodb = boto3.resource("dynamodb")
 
+@functools.lru_cache(maxsize=4)
+def _get_table(table_name: str):
+    """Get a cached DynamoDB Table resource so warm invocations reuse it.
 
-class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder for datetime objects"""
+    Args:
+        table_name (str): Name of the DynamoDB table
 
-    def default(self, obj):
-        """Convert datetime objects to ISO format strings.
+    Returns:
+        DynamoDB Table resource
+    """
+    return dynamodb.Table(table_name)
 
-        Args:
-            obj: Object to encode
 
-        Returns:
-            str: ISO formatted datetime string or default encoding
-        """
-        if isinstance(obj, (datetime.date, datetime.datetime)):
-            return obj.isoformat()
-        return super().default(obj)
+def _load_details(details: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Load stored incident details, which older records keep as a JSON string.
+
+    Args:
+        details (Union[str, Dict[str, Any]]): The stored serviceNowIncidentDetails value
+
+    Returns:
+        Dict[str, Any]: The incident details dictionary
+    """
+    return orjson.loads(details) if isinstance(details, str) else details
+
+
+def _first_present(data: Dict[str, Any], fields: Tuple[str, ...]) -> Optional[Any]:
+    """Get the value of the first field that is present and non-empty.
+
+    Args:
+        data (Dict[str, Any]): Dictionary to search
+        fields (Tuple[str, ...]): Field names to try, in order
+
+    Returns:
+        Optional[Any]: The first non-empty value, or None if no field matches
+    """
+    return next((data[field] for field in fields if data.get(field)), None)
+
+
+def _details_hash(details: Dict[str, Any]) -> str:
+    """Compute a compact hash of incident details for cheap change detection.
+
+    Args:
+        details (Dict[str, Any]): The incident details dictionary
+
+    Returns:
+        str: Hex digest of the canonical (key-sorted) JSON form of the details
+    """
+    return hashlib.blake2b(
+        orjson.dumps(details, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+
+
+@functools.lru_cache(maxsize=32)
+def _response_body(key: str, message: str) -> str:
+    """Serialize a response body, reusing it for the handler's recurring messages.
+
+    Args:
+        key (str): The body field, "message" or "error"
+        message (str): The field value
+
+    Returns:
+        str: JSON response body
+    """
+    return orjson.dumps({key: message}).decode()
 
 
 class BaseEvent:
     """Base class for domain events"""
 
+    __slots__ = ()
+
     event_type = None
     event_source = EVENT_SOURCE
 
@@ -79,13 +184,16 @@ class BaseEvent:
         raise NotImplementedError("Subclasses must implement to_dict()")
 
 
-class IncidentCreatedEvent(BaseEvent):
-    """Domain event for incident creation"""
+class IncidentEvent(BaseEvent):
+    """Base class for domain events carrying ServiceNow incident details"""
 
-    event_type = "IncidentCreated"
+    __slots__ = ("incident",)
+
+    # Incident fields copied into the event payload, in output order
+    _FIELDS: Tuple[str, ...] = ()
 
     def __init__(self, incident: Dict[str, Any]):
-        """Initialize an IncidentCreatedEvent.
+        """Initialize an IncidentEvent.
 
         Args:
             incident (Dict[str, Any]): The incident details dictionary
@@ -99,99 +207,73 @@ class IncidentCreatedEvent(BaseEvent):
         Returns:
             Dictionary representation of the event
         """
-        return {
-            "eventType": self.event_type,
-            "eventSource": self.event_source,
-            "sys_id": self.incident.get("sys_id", ""),
-            "number": self.incident.get("number", ""),
-            "short_description": self.incident.get("short_description", ""),
-            "description": self.incident.get("description", ""),
-            "sys_created_on": self.incident.get("sys_created_on", ""),
-            "sys_created_by": self.incident.get("sys_created_by", ""),
-            "resolved_by": self.incident.get("resolved_by", ""),
-            "resolved_at": self.incident.get("resolved_at", ""),
-            "opened_at": self.incident.get("opened_at", ""),
-            "closed_at": self.incident.get("closed_at", ""),
-            "state": self.incident.get("state", ""),
-            "impact": self.incident.get("impact", ""),
-            "active": self.incident.get("active", ""),
-            "priority": self.incident.get("priority", ""),
-            "caller_id": self.incident.get("caller_id", ""),
-            "urgency": self.incident.get("urgency", ""),
-            "severity": self.incident.get("severity", ""),
-            "comments": self.incident.get("comments", ""),
-            "work_notes": self.incident.get("work_notes", ""),
-            "comments_and_work_notes": self.incident.get("comments_and_work_notes", ""),
-            "close_code": self.incident.get("close_code", ""),
-            "close_notes": self.incident.get("close_notes", ""),
-            "closed_by": self.incident.get("closed_by", ""),
-            "reopened_by": self.incident.get("reopened_by", ""),
-            "assigned_to": self.incident.get("assigned_to", ""),
-            "due_date": self.incident.get("due_date", ""),
-            "sys_tags": self.incident.get("sys_tags", ""),
-            "category": self.incident.get("category", ""),
-            "subcategory": self.incident.get("subcategory", ""),
-            "attachments": self.incident.get("attachments", []),
-        }
+        incident = self.incident
+        event_dict = {"eventType": self.event_type, "eventSource": self.event_source}
+        event_dict.update((field, incident.get(field, "")) for field in self._FIELDS)
+        event_dict["attachments"] = incident.get("attachments", [])
+        return event_dict
 
 
-class IncidentUpdatedEvent(BaseEvent):
-    """Domain event for incident update"""
+class IncidentCreatedEvent(IncidentEvent):
+    """Domain event for incident creation"""
 
-    event_type = "IncidentUpdated"
+    __slots__ = ()
 
-    def __init__(self, incident: Dict[str, Any]):
-        """Initialize an IncidentUpdatedEvent.
+    event_type = "IncidentCreated"
 
-        Args:
-            incident (Dict[str, Any]): The incident details dictionary
-        """
-        self.incident = incident
+    _FIELDS = (
+        "sys_id",
+        "number",
+        "short_description",
+        "description",
+        "sys_created_on",
+        "sys_created_by",
+        "resolved_by",
+        "resolved_at",
+        "opened_at",
+        "closed_at",
+        "state",
+        "impact",
+        "active",
+        "priority",
+        "caller_id",
+        "urgency",
+        "severity",
+        "comments",
+        "work_notes",
+        "comments_and_work_notes",
+        "close_code",
+        "close_notes",
+        "closed_by",
+        "reopened_by",
+        "assigned_to",
+        "due_date",
+        "sys_tags",
+        "category",
+        "subcategory",
+    )
+
+
+class IncidentUpdatedEvent(IncidentEvent):
+    """Domain event for incident update"""
 
-    def to_dict(self) -> Dict[str, Any]:
-        """
-        Convert the event to a dictionary
+    __slots__ = ()
 
-        Returns:
-            Dictionary representation of the event
-        """
-        return {
-            "eventType": self.event_type,
-            "eventSource": self.event_source,
-            "sys_id": self.incident.get("sys_id", ""),
-            "number": self.incident.get("number", ""),
-            "short_description": self.incident.get("short_description", ""),
-            "description": self.incident.get("description", ""),
-            "sys_created_on": self.incident.get("sys_created_on", ""),
-            "sys_created_by": self.incident.get("sys_created_by", ""),
-            "resolved_by": self.incident.get("resolved_by", ""),
-            "resolved_at": self.incident.get("resolved_at", ""),
-            "opened_at": self.incident.get("opened_at", ""),
-            "closed_at": self.incident.get("closed_at", ""),
-            "state": self.incident.get("state", ""),
-            "impact": self.incident.get("impact", ""),
-            "active": self.incident.get("active", ""),
-            "priority": self.incident.get("priority", ""),
-            "caller_id": self.incident.get("caller_id", ""),
-            "urgency": self.incident.get("urgency", ""),
-            "severity": self.incident.get("severity", ""),
-            "comments_and_work_notes": self.incident.get("comments_and_work_notes", ""),
-            "close_code": self.incident.get("close_code", ""),
-            "close_notes": self.incident.get("close_notes", ""),
-            "closed_by": self.incident.get("closed_by", ""),
-            "reopened_by": self.incident.get("reopened_by", ""),
-            "assigned_to": self.incident.get("assigned_to", ""),
-            "due_date": self.incident.get("due_date", ""),
-            "sys_tags": self.incident.get("sys_tags", ""),
-            "category": self.incident.get("category", ""),
-            "subcategory": self.incident.get("subcategory", ""),
-            "attachments": self.incident.get("attachments", []),
-        }
+    event_type = "IncidentUpdated"
+
+    # Comments and work notes are only published on creation
+    _FIELDS = tuple(
+        field
+        for field in IncidentCreatedEvent._FIELDS
+        if field not in ("comments", "work_notes")
+    )
 
 
 class IncidentDeletedEvent(BaseEvent):
     """Domain event for incident deletion"""
 
+    __slots__ = ("incident_id",)
+
     event_type = "IncidentDeleted"
 
     def __init__(self, incident_id: str):
@@ -219,55 +301,66 @@ class IncidentDeletedEvent(BaseEvent):
 class ParameterService:
     """Class to handle parameter operations"""
 
+    __slots__ = ("ssm_client",)
+
     def __init__(self):
         """Initialize the parameter service."""
-        self.ssm_client = boto3.client("ssm")
+        self.ssm_client = ssm_client
 
-    def _get_parameter(self, parameter_name: str) -> Optional[str]:
-        """Get a parameter from SSM Parameter Store.
+    def get_parameters(self, parameter_names: List[str]) -> Dict[str, str]:
+        """Get several parameters from SSM Parameter Store in a single request.
 
         Args:
-            parameter_name (str): The name of the parameter to retrieve
+            parameter_names (List[str]): The names of the parameters to retrieve
 
         Returns:
-            Optional[str]: Parameter value or None if retrieval fails
+            Dict[str, str]: Parameter values keyed by name; names that could not be
+            retrieved are omitted
         """
-        if not parameter_name:
-            logger.error("Parameter name is empty or None")
-            return None
+        missing = [
+            name
+            for name in parameter_names
+            if name and parameter_cache.get(name) is None
+        ]
 
-        try:
-            logger.info(f"Retrieving parameter: {parameter_name}")
-            response = self.ssm_client.get_parameter(
-                Name=parameter_name, WithDecryption=True
-            )
-            return response["Parameter"]["Value"]
-        except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            error_message = e.response["Error"]["Message"]
-            if error_code == "AccessDeniedException":
-                logger.error(
-                    f"Access denied when retrieving parameter {parameter_name}. Check IAM permissions for this Lambda function."
+        if missing:
+            try:
+                logger.info("Retrieving parameters: %s", missing)
+                response = self.ssm_client.get_parameters(
+                    Names=missing, WithDecryption=True
                 )
-            elif error_code == "ParameterNotFound":
+                for parameter in response["Parameters"]:
+                    parameter_cache[parameter["Name"]] = parameter["Value"]
+                if response["InvalidParameters"]:
+                    logger.error(
+                        "Parameters not found. Verify the parameters exist in SSM Parameter Store: %s",
+                        response["InvalidParameters"],
+                    )
+            except ClientError as e:
                 logger.error(
-                    f"Parameter {parameter_name} not found. Verify the parameter exists in SSM Parameter Store."
+                    "Error retrieving parameters %s: %s - %s",
+                    missing,
+                    e.response["Error"]["Code"],
+                    e.response["Error"]["Message"],
                 )
-            else:
+            except Exception as e:
                 logger.error(
-                    f"Error retrieving parameter {parameter_name}: {error_code} - {error_message}"
+                    "Unexpected error retrieving parameters %s: %s", missing, e
                 )
-            return None
-        except Exception as e:
-            logger.error(
-                f"Unexpected error retrieving parameter {parameter_name}: {str(e)}"
-            )
-            return None
+
+        values = {}
+        for name in parameter_names:
+            value = parameter_cache.get(name) if name else None
+            if value is not None:
+                values[name] = value
+        return values
 
 
 class EventPublisherService:
     """Service for publishing events to EventBridge"""
 
+    __slots__ = ("events_client", "event_bus_name")
+
     def __init__(self, event_bus_name: str):
         """
         Initialize an EventPublisherService
@@ -276,7 +369,7 @@ class EventPublisherService:
             event_bus_name: Name of the EventBridge event bus
         """
         logger.debug(
-            f"Initializing EventPublisherService with event bus: {event_bus_name}"
+            "Initializing EventPublisherService with event bus: %s", event_bus_name
         )
         self.events_client = events_client
         self.event_bus_name = event_bus_name
@@ -291,54 +384,121 @@ class EventPublisherService:
         Returns:
             Response from EventBridge
         """
-        logger.info(f"Publishing event: {event.event_type}")
-        event_dict = event.to_dict()
+        return self._publish_events([event])[0]
 
-        try:
-            # Convert the dictionary to a JSON string
-            event_json = json.dumps(event_dict, cls=DateTimeEncoder)
+    def _publish_events(self, events: List[BaseEvent]) -> List[Dict[str, Any]]:
+        """
+        Publish events to the EventBridge event bus in batches of up to
+        PUT_EVENTS_MAX_ENTRIES entries per PutEvents call
+
+        Args:
+            events: The events to publish
 
-            response = self.events_client.put_events(
-                Entries=[
+        Returns:
+            Responses from EventBridge, one per PutEvents batch
+        """
+        try:
+            entries = []
+            for event in events:
+                logger.info("Publishing event: %s", event.event_type)
+                entries.append(
                     {
                         "Source": EVENT_SOURCE,
                         "DetailType": event.event_type,
-                        "Detail": event_json,
+                        # orjson serializes datetime natively
+                        "Detail": orjson.dumps(event.to_dict()).decode(),
                         "EventBusName": self.event_bus_name,
                     }
-                ]
-            )
-            logger.info(f"Event {event.event_type} published successfully")
-            logger.debug(f"Event published successfully: {response}")
-            return response
+                )
+
+            responses = []
+            for start in range(0, len(entries), PUT_EVENTS_MAX_ENTRIES):
+                responses.append(
+                    self.__put_entries(entries[start : start + PUT_EVENTS_MAX_ENTRIES])
+                )
+            logger.info("%s event(s) published successfully", len(entries))
+            logger.debug("Events published successfully: %s", responses)
+            return responses
         except Exception as e:
-            logger.error(f"Error publishing event: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("Error publishing event: %s", e)
             raise
 
+    def __put_entries(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Send a single PutEvents batch, resending only the entries that failed
+
+        Args:
+            entries: EventBridge entries to send (at most PUT_EVENTS_MAX_ENTRIES)
+
+        Returns:
+            Response from the last PutEvents call
+
+        Raises:
+            Exception: If some entries still fail after PUT_EVENTS_MAX_ATTEMPTS attempts
+        """
+        for attempt in range(PUT_EVENTS_MAX_ATTEMPTS):
+            response = self.events_client.put_events(Entries=entries)
+            if not response.get("FailedEntryCount"):
+                return response
+
+            # Results are positional, so pair each result with the entry sent
+            failed = [
+                (entry, result)
+                for entry, result in zip(entries, response["Entries"])
+                if result.get("ErrorCode")
+            ]
+            logger.info(
+                "%s event(s) failed to publish on attempt %s", len(failed), attempt + 1
+            )
+            entries = [entry for entry, _ in failed]
+
+            # Failures are often throttling, so back off before resending
+            if attempt < PUT_EVENTS_MAX_ATTEMPTS - 1:
+                time.sleep(
+                    PUT_EVENTS_BASE_WAIT_SECONDS * 2**attempt
+                    + random.random() * PUT_EVENTS_BASE_WAIT_SECONDS
+                )
+
+        for entry, result in failed:
+            logger.error(
+                f"Failed to publish event {entry['DetailType']}: "
+                f"{result.get('ErrorCode')} - {result.get('ErrorMessage')}"
+            )
+        raise Exception(
+            f"Failed to publish {len(failed)} event(s) after {PUT_EVENTS_MAX_ATTEMPTS} attempts"
+        )
+
 
 class DatabaseService:
     """Service for database operations"""
 
+    __slots__ = ("table", "_cache")
+
     def __init__(self, table_name):
         """Initialize the database service"""
-        self.table = dynamodb.Table(table_name)
+        self.table = _get_table(table_name)
+        # Details found by lookup, reused by repeated lookups for the same incident;
+        # writes drop the entry, and change detection always goes to DynamoDB
+        self._cache = TTLCache(maxsize=512, ttl=30)
 
-    def __should_retry(self, attempt: int, max_retries: int, wait_time: int) -> bool:
+    def __should_retry(self, attempt: int, max_retries: int) -> bool:
         """
-        Check if should retry and handle wait time
+        Check if should retry and wait with exponential backoff and jitter
 
         Args:
             attempt: Current attempt number
             max_retries: Maximum number of retries
-            wait_time: Current wait time
 
         Returns:
             True if should retry, False otherwise
         """
 
         if attempt < max_retries - 1:
-            logger.info(f"Retrying in {wait_time} seconds...")
+            wait_time = min(
+                LOOKUP_MAX_WAIT_SECONDS,
+                LOOKUP_BASE_WAIT_SECONDS * 2**attempt + random.random(),
+            )
+            logger.info("Retrying in %.2f seconds...", wait_time)
             time.sleep(wait_time)
             return True
         else:
@@ -347,41 +507,31 @@ class DatabaseService:
 
     def __get_incident_by_id(
         self, service_now_incident_id: str
-    ) -> List[Dict[str, Any]]:
+    ) -> Optional[Dict[str, Any]]:
         """
-        Scan DynamoDB table for ServiceNow incident ID with retry logic
+        Query the ServiceNow incident ID index with retry logic
 
         Args:
             service_now_incident_id: The ServiceNow incident ID
 
         Returns:
-            List of matching items
+            Stored ServiceNow incident details or None if not found after all retries
         """
         max_retries = 5
-        wait_time = 10
-        # time.sleep(wait_time)
 
         for attempt in range(max_retries):
             try:
-                # TODO: Use GSIs and replace the following scan queries to use the service-now index instead (see https://app.asana.com/1/8442528107068/project/1209571477232011/task/1210189285892844?focus=true)
-                response = self.table.scan(
-                    FilterExpression=Attr("serviceNowIncidentId").eq(
+                response = self.table.query(
+                    IndexName=SERVICE_NOW_INCIDENT_ID_INDEX,
+                    KeyConditionExpression=Key("serviceNowIncidentId").eq(
                         service_now_incident_id
-                    )
+                    ),
+                    Limit=1,
                 )
                 items = response["Items"]
 
-                # Handle pagination if there are more items
-                while "LastEvaluatedKey" in response:
-                    response = self.table.scan(
-                        FilterExpression=Attr("serviceNowIncidentId").eq(
-                            service_now_incident_id
-                        ),
-                        ExclusiveStartKey=response["LastEvaluatedKey"],
-                    )
-                    items.extend(response["Items"])
-
-                # Add retry logic when items is null/empty or missing required key
+                # Retry when the item is missing or only partly written (the ServiceNow
+                # client sets serviceNowIncidentId and the details in separate updates)
                 if not items or "serviceNowIncidentDetails" not in items[0]:
                     reason = (
                         "not found"
@@ -389,29 +539,36 @@ class DatabaseService:
                         else "missing serviceNowIncidentDetails key"
                     )
                     logger.info(
-                        f"ServiceNow incident for {service_now_incident_id} {reason} in database on attempt {attempt + 1}"
+                        "ServiceNow incident for %s %s in database on attempt %s",
+                        service_now_incident_id,
+                        reason,
+                        attempt + 1,
                     )
-                    if not self.__should_retry(attempt, max_retries, wait_time):
+                    if not self.__should_retry(attempt, max_retries):
                         return None
-                    wait_time = max(2, wait_time - 2)  # Decrease by 2s, minimum 2s
                     continue
 
                 logger.info(
-                    f"ServiceNow incident for {service_now_incident_id} found in database. Extracting incident details."
+                    "ServiceNow incident for %s found in database. Extracting incident details.",
+                    service_now_incident_id,
                 )
 
-                return items[0]["serviceNowIncidentDetails"]
+                return _load_details(items[0]["serviceNowIncidentDetails"])
             except Exception as e:
                 logger.info(
-                    f"ServiceNow incident for {service_now_incident_id} not found in database on attempt {attempt + 1}. Error encountered: str{e}"
+                    "ServiceNow incident for %s not found in database on attempt %s. Error encountered: %s",
+                    service_now_incident_id,
+                    attempt + 1,
+                    e,
                 )
-                if not self.__should_retry(attempt, max_retries, wait_time):
-                    return []
-                wait_time = max(2, wait_time - 2)  # Decrease by 2s, minimum 2s
+                if not self.__should_retry(attempt, max_retries):
+                    return None
                 continue
         return None
 
-    def _get_incident_details(self, service_now_incident_id: str) -> Optional[str]:
+    def _get_incident_details(
+        self, service_now_incident_id: str
+    ) -> Optional[Dict[str, Any]]:
         """
         Get ServiceNow incident details from the database
 
@@ -421,19 +578,28 @@ class DatabaseService:
         Returns:
             ServiceNow incident details or None if not found
         """
+        cached_details = self._cache.get(service_now_incident_id)
+        if cached_details is not None:
+            logger.info(
+                "Incident details for %s found in cache.", service_now_incident_id
+            )
+            return cached_details
+
         try:
             service_now_incident_details = self.__get_incident_by_id(
                 service_now_incident_id
             )
             if not service_now_incident_details:
                 logger.info(
-                    f"All retries completed. Incident details for {service_now_incident_id} not found in database."
+                    "All retries completed. Incident details for %s not found in database.",
+                    service_now_incident_id,
                 )
                 return None
 
             logger.info(
-                f"Incident details for {service_now_incident_id} found in database."
+                "Incident details for %s found in database.", service_now_incident_id
             )
+            self._cache[service_now_incident_id] = service_now_incident_details
             return service_now_incident_details
         except Exception as e:
             logger.error(f"Error retrieving details from the DynamoDB table: {e}")
@@ -452,28 +618,30 @@ class DatabaseService:
         Returns:
             True if successful, False otherwise
         """
+        self._cache.pop(service_now_incident_id, None)
         try:
-            # Convert the incident details to a JSON string for storage
-            service_now_details_json = json.dumps(service_now_incident_details)
-
             # Use a composite key pattern with a prefix to maintain data model integrity
             case_id = f"ServiceNow#{service_now_incident_id}"
 
             # Create a new entry with the ServiceNow incident ID and details
             logger.info(
-                f"Creating a new entry with CaseId {case_id} for ServiceNow incident {service_now_incident_id} in DynamoDb table"
+                "Creating a new entry with CaseId %s for ServiceNow incident %s in DynamoDb table",
+                case_id,
+                service_now_incident_id,
             )
             self.table.put_item(
                 Item={
                     "PK": case_id,
                     "SK": "latest",
                     "serviceNowIncidentId": service_now_incident_id,
-                    "serviceNowIncidentDetails": service_now_details_json,
+                    "serviceNowIncidentDetails": service_now_incident_details,
+                    "detailsHash": _details_hash(service_now_incident_details),
                 }
             )
 
             logger.info(
-                f"Successfully added details to DynamoDb table for ServiceNow incident {service_now_incident_id}"
+                "Successfully added details to DynamoDb table for ServiceNow incident %s",
+                service_now_incident_id,
             )
             return True
         except Exception as e:
@@ -495,26 +663,30 @@ class DatabaseService:
         Returns:
             True if successful, False otherwise
         """
+        self._cache.pop(service_now_incident_id, None)
         try:
-            # Convert the incident details to a JSON string for storage
-            service_now_details_json = json.dumps(service_now_incident_details)
-
             # Use a composite key pattern with a prefix to maintain data model integrity
             case_id = f"ServiceNow#{service_now_incident_id}"
 
             # Update the existing entry with the ServiceNow incident ID and details
             logger.info(
-                f"Updating entry with CaseId {case_id} for ServiceNow incident {service_now_incident_id} in DynamoDb table"
+                "Updating entry with CaseId %s for ServiceNow incident %s in DynamoDb table",
+                case_id,
+                service_now_incident_id,
             )
             self.table.update_item(
                 Key={"PK": f"{case_id}", "SK": "latest"},
-                UpdateExpression="set serviceNowIncidentDetails = :s",
-                ExpressionAttributeValues={":s": service_now_details_json},
+                UpdateExpression="set serviceNowIncidentDetails = :s, detailsHash = :h",
+                ExpressionAttributeValues={
+                    ":s": service_now_incident_details,
+                    ":h": _details_hash(service_now_incident_details),
+                },
                 ReturnValues="UPDATED_NEW",
             )
 
             logger.info(
-                f"Successfully updated details in DynamoDb table for ServiceNow incident {service_now_incident_id}"
+                "Successfully updated details in DynamoDb table for ServiceNow incident %s",
+                service_now_incident_id,
             )
             return True
         except Exception as e:
@@ -523,10 +695,93 @@ class DatabaseService:
             )
             return False
 
+    def _update_incident_details_if_changed(
+        self, service_now_incident_id: str, service_now_incident_details: Dict[str, Any]
+    ) -> Optional[bool]:
+        """
+        Atomically update incident details in DynamoDB when they differ from the stored copy
+
+        Args:
+            service_now_incident_id: The ServiceNow incident ID
+            service_now_incident_details: The incident details from ServiceNow
+
+        Returns:
+            True if the details were updated, False if they were unchanged,
+            or None if no ServiceNow-keyed record exists yet
+        """
+        self._cache.pop(service_now_incident_id, None)
+        case_id = f"ServiceNow#{service_now_incident_id}"
+
+        # Compare on the stored hash rather than the full details payload
+        try:
+            response = self.table.update_item(
+                Key={"PK": case_id, "SK": "latest"},
+                UpdateExpression="set serviceNowIncidentDetails = :s, detailsHash = :h",
+                ConditionExpression="attribute_exists(PK) AND (attribute_not_exists(detailsHash) OR detailsHash <> :h)",
+                ExpressionAttributeValues={
+                    ":s": service_now_incident_details,
+                    ":h": _details_hash(service_now_incident_details),
+                },
+                ReturnValues="UPDATED_OLD",
+                ReturnValuesOnConditionCheckFailure="ALL_OLD",
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                logger.error(
+                    f"Error updating details in DynamoDb table for ServiceNow incident {service_now_incident_id}: {str(e)}"
+                )
+                return None
+            # The old item is only returned when the record exists, i.e. the details are unchanged
+            return False if e.response.get("Item") else None
+
+        # Records written before detailsHash existed were backfilled above; only
+        # report a change if their stored details actually differ
+        old_attributes = response.get("Attributes", {})
+        if "detailsHash" not in old_attributes:
+            old_details = old_attributes.get("serviceNowIncidentDetails")
+            if (
+                old_details
+                and _load_details(old_details) == service_now_incident_details
+            ):
+                return False
+
+        logger.info(
+            "Successfully updated details in DynamoDb table for ServiceNow incident %s",
+            service_now_incident_id,
+        )
+        return True
+
+    def _invalidate_details_hash(self, service_now_incident_id: str) -> bool:
+        """
+        Clear the stored details hash so the next webhook reports the details as changed
+
+        Args:
+            service_now_incident_id: The ServiceNow incident ID
+
+        Returns:
+            True if successful, False otherwise
+        """
+        self._cache.pop(service_now_incident_id, None)
+        try:
+            self.table.update_item(
+                Key={"PK": f"ServiceNow#{service_now_incident_id}", "SK": "latest"},
+                UpdateExpression="set detailsHash = :h",
+                ConditionExpression="attribute_exists(PK)",
+                ExpressionAttributeValues={":h": ""},
+            )
+            return True
+        except Exception as e:
+            logger.error(
+                f"Error invalidating details hash for ServiceNow incident {service_now_incident_id}: {str(e)}"
+            )
+            return False
+
 
 class ServiceNowService:
     """Service for ServiceNow operations"""
 
+    __slots__ = ("service_now_client",)
+
     def __init__(self, instance_id, username, password_param_name):
         """Initialize the ServiceNow service"""
         self.service_now_client = ServiceNowClient(
@@ -546,17 +801,19 @@ class ServiceNowService:
             Dictionary of incident details or None if retrieval fails
         """
         try:
-            integration_module = os.environ.get("INTEGRATION_MODULE", "itsm")
-            service_now_incident = (
-                self.service_now_client.get_incident_with_display_values(
-                    service_now_incident_id, integration_module
-                )
+            # The incident and its attachments are independent requests, so fetch them concurrently
+            incident_future = executor.submit(
+                self.service_now_client.get_incident_with_display_values,
+                service_now_incident_id,
+                INTEGRATION_MODULE,
             )
-            service_now_incident_attachments = (
-                self.service_now_client.get_incident_attachments_details(
-                    service_now_incident_id, integration_module
-                )
+            attachments_future = executor.submit(
+                self.service_now_client.get_incident_attachments_details,
+                service_now_incident_id,
+                INTEGRATION_MODULE,
             )
+            service_now_incident = incident_future.result()
+            service_now_incident_attachments = attachments_future.result()
             if not service_now_incident:
                 logger.error(
                     f"Failed to get incident {service_now_incident_id} from ServiceNow"
@@ -575,6 +832,8 @@ class ServiceNowService:
 class ServiceNowMessageProcessorService:
     """Class to handle ServiceNow message processing"""
 
+    __slots__ = ("db_service", "service_now_service", "event_publisher_service")
+
     def __init__(
         self, instance_id, username, password_param_name, table_name, event_bus_name
     ):
@@ -585,7 +844,7 @@ class ServiceNowMessageProcessorService:
         )
         self.event_publisher_service = EventPublisherService(event_bus_name)
 
-    def _extract_event_body(self, event):
+    def _extract_event_body(self, event) -> Union[Dict[str, Any], str]:
         """
         Extract the request body from the event
 
@@ -593,7 +852,7 @@ class ServiceNowMessageProcessorService:
             event: The event payload
 
         Returns:
-            Request body from the event payload
+            Request body from the event payload, as a dict if it is already structured
         """
         try:
             # Extract the request body from API Gateway event
@@ -608,24 +867,18 @@ class ServiceNowMessageProcessorService:
 
             # If body is already a dict, return it as is
             if isinstance(body, dict):
-                return json.dumps(body)
+                return body
 
             # If body is a string but not JSON, try to parse it as form data
             if isinstance(body, str) and not body.strip().startswith("{"):
                 if "=" in body:
-                    # Simple form data parsing
-                    form_data = {}
-                    for pair in body.split("&"):
-                        if "=" in pair:
-                            key, value = pair.split("=", 1)
-                            form_data[key] = value
-                    logger.debug(f"Parsed form data: {form_data}")
-                    return json.dumps(form_data)
+                    form_data = dict(parse_qsl(body, keep_blank_values=True))
+                    logger.debug("Parsed form data: %s", form_data)
+                    return form_data
 
             return body
         except Exception as e:
-            logger.error(f"Failed to extract event body: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("Failed to extract event body: %s", e)
             return "{}"
 
     def _parse_message(self, message: str) -> Dict[str, Any]:
@@ -652,30 +905,25 @@ class ServiceNowMessageProcessorService:
 
                 # Try to parse as JSON
                 try:
-                    return json.loads(message)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse as JSON: {str(e)}")
+                    return orjson.loads(message)
+                except orjson.JSONDecodeError as e:
+                    logger.warning("Failed to parse as JSON: %s", e)
 
                     # If not JSON, try to parse as URL-encoded form data
                     if "=" in message:
-                        form_data = {}
-                        for pair in message.split("&"):
-                            if "=" in pair:
-                                key, value = pair.split("=", 1)
-                                form_data[key] = value
-                        logger.info(f"Parsed as form data: {form_data}")
+                        form_data = dict(parse_qsl(message, keep_blank_values=True))
+                        logger.info("Parsed as form data: %s", form_data)
                         return form_data
 
                     # If it's a single value, try to use it as incident_number
                     if message.strip().isalnum():
-                        logger.info(f"Using message as incident_number: {message}")
+                        logger.info("Using message as incident_number: %s", message)
                         return {"incident_number": message.strip()}
 
             logger.error(f"Unable to parse message: {message}")
             return {}
         except Exception as e:
-            logger.error(f"Error parsing message: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("Error parsing message: %s", e)
             return {}
 
     def _process_webhook_payload(self, payload: Dict[str, Any]) -> bool:
@@ -688,56 +936,15 @@ class ServiceNowMessageProcessorService:
         Returns:
             True if processing was successful, False otherwise
         """
-        # Log the full payload for debugging
-        logger.info(f"Processing webhook payload: {json.dumps(payload)}")
+        # Log the full payload for debugging; formatted only if INFO is enabled
+        logger.info("Processing webhook payload: %s", payload)
 
-        # Try different field names that might contain the incident number
+        # Look for the incident number at the top level, then in nested structures
         incident_number = None
-        possible_fields = [
-            "incident_number",
-            "number",
-            "sys_id",
-            "id",
-            "incident_id",
-            "incidentNumber",
-        ]
-
-        for field in possible_fields:
-            if field in payload and payload[field]:
-                incident_number = payload[field]
-                logger.info(
-                    f"Found incident number in field '{field}': {incident_number}"
-                )
-                break
-
-        # If we still don't have an incident number, check if there's a nested structure
-        if (
-            not incident_number
-            and "incident" in payload
-            and isinstance(payload["incident"], dict)
-        ):
-            incident = payload["incident"]
-            for field in possible_fields:
-                if field in incident and incident[field]:
-                    incident_number = incident[field]
-                    logger.info(
-                        f"Found incident number in nested field 'incident.{field}': {incident_number}"
-                    )
-                    break
-
-        # If we still don't have an incident number, check if there's a result field
-        if (
-            not incident_number
-            and "result" in payload
-            and isinstance(payload["result"], dict)
-        ):
-            result = payload["result"]
-            for field in possible_fields:
-                if field in result and result[field]:
-                    incident_number = result[field]
-                    logger.info(
-                        f"Found incident number in nested field 'result.{field}': {incident_number}"
-                    )
+        for container in (payload, payload.get("incident"), payload.get("result")):
+            if isinstance(container, dict):
+                incident_number = _first_present(container, INCIDENT_NUMBER_FIELDS)
+                if incident_number:
                     break
 
         if not incident_number:
@@ -746,7 +953,7 @@ class ServiceNowMessageProcessorService:
 
         event_type = payload.get("event_type", "unknown")
         logger.info(
-            f"Processing incident: {incident_number} with event_type: {event_type}"
+            "Processing incident: %s with event_type: %s", incident_number, event_type
         )
 
         # Get incident details and process based on event type
@@ -772,7 +979,33 @@ class ServiceNowMessageProcessorService:
             )
             return False
 
-        # Get existing incident details from database
+        # Try a single conditional write against the ServiceNow-keyed record first
+        updated = self.db_service._update_incident_details_if_changed(
+            incident_number, service_now_incident_details
+        )
+        if updated is not None:
+            try:
+                if updated:
+                    logger.info(
+                        "Publishing IncidentUpdatedEvent for ServiceNow incident %s",
+                        incident_number,
+                    )
+                    self.event_publisher_service._publish_event(
+                        IncidentUpdatedEvent(service_now_incident_details)
+                    )
+                else:
+                    logger.info("No changes detected for incident %s", incident_number)
+                return True
+            except Exception as e:
+                logger.error(
+                    f"Error handling existing incident {incident_number}: {str(e)}"
+                )
+                # Let a later webhook detect the change again and republish it
+                self.db_service._invalidate_details_hash(incident_number)
+                return False
+
+        # Fall back to a lookup for records not yet stored under the ServiceNow key
+        # (e.g. those created by the ServiceNow client with a Case# key)
         service_now_incident_details_ddb = self.db_service._get_incident_details(
             incident_number
         )
@@ -804,7 +1037,8 @@ class ServiceNowMessageProcessorService:
         """
         try:
             logger.info(
-                f"Publishing IncidentCreatedEvent for ServiceNow incident {incident_number}"
+                "Publishing IncidentCreatedEvent for ServiceNow incident %s",
+                incident_number,
             )
             self.db_service._add_incident_details(incident_number, incident_details)
             self.event_publisher_service._publish_event(
@@ -819,7 +1053,7 @@ class ServiceNowMessageProcessorService:
         self,
         incident_number: str,
         incident_details: Dict[str, Any],
-        existing_details: str,
+        existing_details: Dict[str, Any],
     ) -> bool:
         """
         Handle an existing incident that's already in the database
@@ -834,13 +1068,12 @@ class ServiceNowMessageProcessorService:
         """
         try:
             # Compare incident details to detect changes
-            logger.info(f"Latest Incident details from ServiceNow {incident_details}")
-            logger.info(
-                f"Existing Incident details from DDB {json.loads(existing_details)}"
-            )
-            if incident_details != json.loads(existing_details):
+            logger.info("Latest Incident details from ServiceNow %s", incident_details)
+            logger.info("Existing Incident details from DDB %s", existing_details)
+            if incident_details != existing_details:
                 logger.info(
-                    f"Publishing IncidentUpdatedEvent for ServiceNow incident {incident_number}"
+                    "Publishing IncidentUpdatedEvent for ServiceNow incident %s",
+                    incident_number,
                 )
                 self.db_service._update_incident_details(
                     incident_number, incident_details
@@ -849,12 +1082,14 @@ class ServiceNowMessageProcessorService:
                     IncidentUpdatedEvent(incident_details)
                 )
             else:
-                logger.info(f"No changes detected for incident {incident_number}")
+                logger.info("No changes detected for incident %s", incident_number)
             return True
         except Exception as e:
             logger.error(
                 f"Error handling existing incident {incident_number}: {str(e)}"
             )
+            # Let a later webhook detect the change again and republish it
+            self.db_service._invalidate_details_hash(incident_number)
             return False
 
 
@@ -874,13 +1109,8 @@ class ResponseBuilderService:
         """
         return {
             "statusCode": 200,
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Headers": "Content-Type",
-                "Access-Control-Allow-Methods": "POST,OPTIONS",
-            },
-            "body": json.dumps({"message": message}),
+            "headers": dict(CORS_HEADERS),
+            "body": _response_body("message", message),
         }
 
     @staticmethod
@@ -896,17 +1126,92 @@ class ResponseBuilderService:
         """
         return {
             "statusCode": 500,
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Headers": "Content-Type",
-                "Access-Control-Allow-Methods": "POST,OPTIONS",
-            },
-            "body": json.dumps({"error": error}),
+            "headers": dict(CORS_HEADERS),
+            "body": _response_body("error", error),
         }
 
 
-# @logger.inject_lambda_context
+# Message processor reused across warm invocations of this execution environment
+_processor: Optional[ServiceNowMessageProcessorService] = None
+
+
+def _get_processor(
+    table_name: str, event_bus_name: str
+) -> Optional[ServiceNowMessageProcessorService]:
+    """
+    Get the message processor, creating it on first use
+
+    Args:
+        table_name: Name of the DynamoDB incidents table
+        event_bus_name: Name of the EventBridge event bus
+
+    Returns:
+        The message processor or None if the ServiceNow credentials could not be retrieved
+    """
+    global _processor
+    if _processor is None:
+        parameter_service = ParameterService()
+        instance_id_param = os.environ.get("SERVICE_NOW_INSTANCE_ID")
+        username_param = os.environ.get("SERVICE_NOW_USER")
+        password_param_name = os.environ.get("SERVICE_NOW_PASSWORD_PARAM")
+
+        logger.info(
+            "Getting parameters: %s, %s, %s",
+            instance_id_param,
+            username_param,
+            password_param_name,
+        )
+
+        parameters = parameter_service.get_parameters(
+            [instance_id_param, username_param]
+        )
+        instance_id = parameters.get(instance_id_param)
+        username = parameters.get(username_param)
+
+        if not instance_id or not username or not password_param_name:
+            logger.error("Failed to retrieve ServiceNow credentials from SSM")
+            return None
+
+        _processor = ServiceNowMessageProcessorService(
+            instance_id, username, password_param_name, table_name, event_bus_name
+        )
+    return _processor
+
+
+def _warm_up_service_now_connection(
+    processor: ServiceNowMessageProcessorService,
+) -> None:
+    """
+    Open the pooled HTTPS connection to the ServiceNow instance ahead of the first request
+
+    Args:
+        processor: The message processor holding the ServiceNow client
+    """
+    snow_client = processor.service_now_service.service_now_client.client
+    if snow_client is None:
+        return
+    try:
+        snow_client.session.head(snow_client.instance, timeout=2)
+    except Exception as e:
+        logger.warning("ServiceNow connection warm-up failed: %s", e)
+
+
+# With provisioned concurrency, build the processor (SSM lookups and the ServiceNow
+# client) and connect to ServiceNow during environment initialization rather than
+# on the first request
+if os.environ.get("AWS_LAMBDA_INITIALIZATION_TYPE") == "provisioned-concurrency":
+    try:
+        _initial_processor = _get_processor(
+            os.environ["INCIDENTS_TABLE_NAME"],
+            os.environ.get("EVENT_BUS_NAME", "default"),
+        )
+        if _initial_processor is not None:
+            _warm_up_service_now_connection(_initial_processor)
+    except Exception as e:
+        logger.warning("Deferring processor initialization to first request: %s", e)
+
+
+@logger.inject_lambda_context
 def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
     """
     Lambda handler for processing API Gateway webhook events from ServiceNow
@@ -924,16 +1229,7 @@ def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
 
         # Handle OPTIONS request for CORS
         if event.get("httpMethod") == "OPTIONS":
-            return {
-                "statusCode": 200,
-                "headers": {
-                    "Content-Type": "application/json",
-                    "Access-Control-Allow-Origin": "*",
-                    "Access-Control-Allow-Headers": "Content-Type,Authorization",
-                    "Access-Control-Allow-Methods": "POST,OPTIONS",
-                },
-                "body": "",
-            }
+            return {"statusCode": 200, "headers": dict(OPTIONS_HEADERS), "body": ""}
 
         # Validate event structure
         if not isinstance(event, dict):
@@ -943,29 +1239,17 @@ def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
         try:
             table_name = os.environ["INCIDENTS_TABLE_NAME"]
             event_bus_name = os.environ.get("EVENT_BUS_NAME", "default")
-            logger.info(f"Using table: {table_name}, event bus: {event_bus_name}")
+            logger.info("Using table: %s, event bus: %s", table_name, event_bus_name)
         except KeyError as e:
             logger.error(f"Missing required environment variable: {str(e)}")
             return ResponseBuilderService._build_error_response(
                 f"Configuration error: Missing {str(e)}"
             )
 
-        # Get credentials from SSM
+        # Get the processor, building it from SSM credentials on first use
         try:
-            parameter_service = ParameterService()
-            instance_id_param = os.environ.get("SERVICE_NOW_INSTANCE_ID")
-            username_param = os.environ.get("SERVICE_NOW_USER")
-            password_param_name = os.environ.get("SERVICE_NOW_PASSWORD_PARAM")
-
-            logger.info(
-                f"Getting parameters: {instance_id_param}, {username_param}, {password_param_name}"
-            )
-
-            instance_id = parameter_service._get_parameter(instance_id_param)
-            username = parameter_service._get_parameter(username_param)
-
-            if not instance_id or not username or not password_param_name:
-                logger.error("Failed to retrieve ServiceNow credentials from SSM")
+            processor = _get_processor(table_name, event_bus_name)
+            if processor is None:
                 return ResponseBuilderService._build_error_response(
                     "Failed to retrieve ServiceNow credentials"
                 )
@@ -975,15 +1259,9 @@ def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
                 f"Parameter retrieval error: {str(e)}"
             )
 
-        # Create processor
-        processor = ServiceNowMessageProcessorService(
-            instance_id, username, password_param_name, table_name, event_bus_name
-        )
-        processed_count = 0
-
         # Extract the request body from API Gateway event
         body = processor._extract_event_body(event)
-        if body is None or body == "{}":
+        if not body or body == "{}":
             logger.error("Empty or invalid request body")
             return ResponseBuilderService._build_error_response(
                 "Empty or invalid request body"
@@ -1000,25 +1278,19 @@ def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
                 "Missing required fields in payload"
             )
 
-        # Process the webhook payload
-        success = processor._process_webhook_payload(payload)
-
-        if not success:
+        # Process the webhook payload (a webhook carries a single record)
+        if not processor._process_webhook_payload(payload):
             logger.error("Failed to process ServiceNow webhook payload")
             return ResponseBuilderService._build_error_response(
                 "Failed to process ServiceNow webhook payload"
             )
 
-        processed_count += 1
-        logger.info(f"Successfully processed {processed_count} records")
-
-        return ResponseBuilderService._build_success_response(
-            f"Successfully processed {processed_count} records"
-        )
+        message = "Successfully processed 1 records"
+        logger.info(message)
+        return ResponseBuilderService._build_success_response(message)
 
     except Exception as e:
-        logger.error(f"Error in Lambda handler: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error in Lambda handler: %s", e)
         return ResponseBuilderService._build_error_response(
             f"Internal server error: {str(e)}"
         )
@@ -1,29 +1,309 @@
-import json
-from typing import Optional
-import boto3
-import requests
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+import orjson
 import os
 from base64 import b64encode
+from string import Template
 import logging
 from botocore.exceptions import ClientError
 
 # Configure logging
 logger = logging.getLogger()
 
-# Get log level from environment variable
+# Get log level from environment variable, defaulting to ERROR
 log_level = os.environ.get("LOG_LEVEL", "error").lower()
-if log_level == "debug":
-    logger.setLevel(logging.DEBUG)
-elif log_level == "info":
-    logger.setLevel(logging.INFO)
-else:
-    # Default to ERROR level
-    logger.setLevel(logging.ERROR)
-
-ssm_client = boto3.client("ssm")
-secrets_client = boto3.client("secretsmanager")
+logger.setLevel(
+    {"debug": logging.DEBUG, "info": logging.INFO}.get(log_level, logging.ERROR)
+)
+
 request_content = "application/json"
 
+# Body template of the outbound REST message function and the parameters it references
+REQUEST_CONTENT_TEMPLATE = '{"event_type":"${event_type}","incident_number":"${incident_number}","short_description":"${short_description}"}'
+REQUEST_CONTENT_PARAMETERS = ("event_type", "incident_number", "short_description")
+
+# Scripts of the Business Rules publishing Incident and attachment events through the
+# Outbound REST Message, for the ITSM and Security Incident Response (IR) modules
+INCIDENT_BUSINESS_RULE_SCRIPT_ITSM = Template("""
+        (function executeRule(current, previous) {
+            try {
+                var event_type = previous ? 'IncidentUpdated' : 'IncidentCreated';
+                var payload = {
+                    "event_type": event_type,
+                    "incident_number": current.number.toString(),
+                    "short_description": current.short_description.toString(),
+                };
+                var outbound_rest_message_name_str = "$outbound_rest_message_name";
+                var outbound_rest_message_request_function_name_str = "$outbound_rest_message_request_function_name";
+                var request = new sn_ws.RESTMessageV2(outbound_rest_message_name_str, outbound_rest_message_request_function_name_str);
+                request.setRequestBody(JSON.stringify(payload));
+                
+                var response = request.executeAsync();
+                gs.info('Incident event published to AWS Security Incident Response API Gateway: ' + event_type);
+                var responseBody = response.getBody();
+                var httpStatus = response.getStatusCode();
+                gs.info("Incident Event Response: " + responseBody);
+                gs.info("Incident Event HTTP Status: " + httpStatus);
+                
+            } catch (error) {
+                gs.error('Error sending incident event: ' + error.message);
+            }
+        })(current, previous);
+        """)
+INCIDENT_BUSINESS_RULE_SCRIPT_IR = Template("""
+        (function executeRule(current, previous) {
+            try {
+                var event_type = previous ? 'IncidentUpdated' : 'IncidentCreated';
+                var payload = {
+                    "event_type": event_type,
+                    "incident_number": current.number.toString(),
+                    "short_description": current.short_description.toString(),
+                };
+                var outbound_rest_message_name_str = "$outbound_rest_message_name";
+                var outbound_rest_message_request_function_name_str = "$outbound_rest_message_request_function_name";
+                var request = new sn_ws.RESTMessageV2(outbound_rest_message_name_str, outbound_rest_message_request_function_name_str);
+                request.setRequestBody(JSON.stringify(payload));
+                
+                var response = request.executeAsync();
+                gs.info('Security Incident event published to AWS Security Incident Response API Gateway: ' + event_type);
+                var responseBody = response.getBody();
+                var httpStatus = response.getStatusCode();
+                gs.info("Security Incident Event Response: " + responseBody);
+                gs.info("Security Incident Event HTTP Status: " + httpStatus);
+                
+            } catch (error) {
+                gs.error('Error sending security incident event: ' + error.message);
+            }
+        })(current, previous);
+        """)
+ATTACHMENT_BUSINESS_RULE_SCRIPT_ITSM = Template("""
+        (function executeRule(current, previous) {
+            try {
+                // Only process attachments for incident table
+                gs.info('The current table name is:' + current.table_name);
+                if (current.table_name != 'incident') {
+                    return;
+                }
+                
+                var event_type = 'IncidentUpdated';
+                var incident_sys_id = current.table_sys_id.getDisplayValue().toString();
+				gs.info('The incident sys_id: ' + incident_sys_id);
+                
+                // Get incident record to fetch incident number
+                var incident = new GlideRecord('incident');
+                if (incident.get(incident_sys_id)) {
+                    var payload = {
+                        "event_type": event_type,
+                        "incident_number": incident.number.toString(),
+                        "short_description": incident.short_description.toString(),
+                    };
+                    
+                    var outbound_rest_message_name_str = "$outbound_rest_message_name";
+                    var outbound_rest_message_request_function_name_str = "$outbound_rest_message_request_function_name";
+                    var request = new sn_ws.RESTMessageV2(outbound_rest_message_name_str, outbound_rest_message_request_function_name_str);
+                    request.setRequestBody(JSON.stringify(payload));
+                    
+                    var response = request.executeAsync();
+                    gs.info('Incident attachment event published to AWS Security Incident Response API Gateway: ' + event_type);
+                    var responseBody = response.getBody();
+                    var httpStatus = response.getStatusCode();
+                    gs.info("Attachment Event Response: " + responseBody);
+                    gs.info("Attachment Event HTTP Status: " + httpStatus);
+                } else {
+                    gs.warn('Could not find incident with sys_id: ' + incident_sys_id);
+                }
+                
+            } catch (error) {
+                gs.error('Error sending incident attachment event: ' + error.message);
+            }
+        })(current, previous);
+        """)
+ATTACHMENT_BUSINESS_RULE_SCRIPT_IR = Template("""
+        (function executeRule(current, previous) {
+            try {
+                // Only process attachments for incident table
+                gs.info('The current table name is:' + current.table_name);
+                if (current.table_name != 'sn_si_incident') {
+                    return;
+                }
+                
+                var event_type = 'IncidentUpdated';
+                var incident_sys_id = current.table_sys_id.getDisplayValue().toString();
+				gs.info('The incident sys_id: ' + incident_sys_id);
+                
+                // Get incident record to fetch incident number
+                var incident = new GlideRecord('sn_si_incident');
+                if (incident.get(incident_sys_id)) {
+                    var payload = {
+                        "event_type": event_type,
+                        "incident_number": incident.number.toString(),
+                        "short_description": incident.short_description.toString(),
+                    };
+                    
+                    var outbound_rest_message_name_str = "$outbound_rest_message_name";
+                    var outbound_rest_message_request_function_name_str = "$outbound_rest_message_request_function_name";
+                    var request = new sn_ws.RESTMessageV2(outbound_rest_message_name_str, outbound_rest_message_request_function_name_str);
+                    request.setRequestBody(JSON.stringify(payload));
+                    
+                    var response = request.executeAsync();
+                    gs.info('Incident attachment event published to AWS Security Incident Response API Gateway: ' + event_type);
+                    var responseBody = response.getBody();
+                    var httpStatus = response.getStatusCode();
+                    gs.info("Attachment Event Response: " + responseBody);
+                    gs.info("Attachment Event HTTP Status: " + httpStatus);
+                } else {
+                    gs.warn('Could not find incident with sys_id: ' + incident_sys_id);
+                }
+                
+            } catch (error) {
+                gs.error('Error sending incident attachment event: ' + error.message);
+            }
+        })(current, previous);
+        """)
+
+
+# Upper bound on concurrent requests to the ServiceNow instance, to stay clear of its
+# API rate limits
+SERVICE_NOW_MAX_CONCURRENCY = int(os.environ.get("SERVICE_NOW_MAX_CONCURRENCY", "5"))
+
+# (connect, read) timeouts in seconds for ServiceNow API requests; an unreachable
+# instance fails fast while slow table inserts still get the full read timeout
+REQUEST_TIMEOUT = (5, 25)
+
+
+# boto3 and requests are imported on first use rather than at module load, so DELETE
+# requests, which return immediately, don't pay for importing them on a cold start
+@functools.lru_cache(maxsize=None)
+def get_client(service_name: str):
+    """Get a boto3 client for the given service, creating it on first use.
+
+    Args:
+        service_name (str): The AWS service name, e.g. "ssm"
+
+    Returns:
+        boto3 client for the service
+    """
+    import boto3
+    from botocore.config import Config
+
+    # Standard retries, TCP keepalive so warm invocations reuse connections, and
+    # tight timeouts instead of the 60s defaults
+    return boto3.client(
+        service_name,
+        config=Config(
+            retries={"mode": "standard", "max_attempts": 3},
+            tcp_keepalive=True,
+            connect_timeout=2,
+            read_timeout=5,
+            max_pool_connections=10,
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def create_session():
+    """Get the pooled requests session for ServiceNow API requests, creating it on first use.
+
+    The session is shared across warm invocations, and its sockets use TCP keepalive
+    so idle pooled connections stay usable. Connection failures and throttled (429)
+    requests, which ServiceNow rejected without processing, are retried with backoff
+    honoring Retry-After; read errors are not, since a POST may already have created
+    its record.
+
+    Returns:
+        requests.Session: Session with a pooled, retrying HTTPS adapter
+    """
+    import socket
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
+    from urllib3.util.retry import Retry
+
+    socket_options = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+
+    class KeepAliveAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs["socket_options"] = socket_options
+            super().init_poolmanager(*args, **kwargs)
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        KeepAliveAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3,
+                read=0,
+                backoff_factor=0.2,
+                status_forcelist=(429,),
+                allowed_methods=frozenset({"GET", "POST"}),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return session
+
+
+# SSM parameter values cached across warm invocations, keyed by parameter name
+SSM_CACHE_TTL = int(os.environ.get("SSM_CACHE_TTL", "300"))
+parameter_cache: Dict[str, Tuple[float, str]] = {}
+
+
+def get_cached_parameter(parameter_name: str) -> str:
+    """Get a decrypted SSM parameter value, reusing it for SSM_CACHE_TTL seconds.
+
+    Args:
+        parameter_name (str): The name of the parameter to retrieve
+
+    Returns:
+        str: Parameter value
+    """
+    cached = parameter_cache.get(parameter_name)
+    if cached and time.monotonic() - cached[0] < SSM_CACHE_TTL:
+        return cached[1]
+
+    response = get_client("ssm").get_parameter(Name=parameter_name, WithDecryption=True)
+    value = response["Parameter"]["Value"]
+    parameter_cache[parameter_name] = (time.monotonic(), value)
+    return value
+
+
+def get_cached_parameters(parameter_names: List[str]) -> Dict[str, str]:
+    """Get several decrypted SSM parameter values in a single request, reusing cached ones.
+
+    Args:
+        parameter_names (List[str]): The names of the parameters to retrieve
+
+    Returns:
+        Dict[str, str]: Parameter values keyed by name; names SSM does not know are omitted
+    """
+    now = time.monotonic()
+    values = {}
+    missing = []
+    for name in parameter_names:
+        cached = parameter_cache.get(name)
+        if cached and now - cached[0] < SSM_CACHE_TTL:
+            values[name] = cached[1]
+        else:
+            missing.append(name)
+
+    if missing:
+        response = get_client("ssm").get_parameters(Names=missing, WithDecryption=True)
+        for parameter in response["Parameters"]:
+            parameter_cache[parameter["Name"]] = (now, parameter["Value"])
+            values[parameter["Name"]] = parameter["Value"]
+        if response["InvalidParameters"]:
+            logger.error(f"Parameters not found: {response['InvalidParameters']}")
+    return values
+
 
 class ParameterService:
     """Class to handle parameter operations"""
@@ -41,15 +321,32 @@ class ParameterService:
             Optional[str]: Parameter value or None if retrieval fails
         """
         try:
-            response = ssm_client.get_parameter(
-                Name=parameter_name, WithDecryption=True
-            )
-            return response["Parameter"]["Value"]
+            return get_cached_parameter(parameter_name)
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
             logger.error(f"Error retrieving parameter {parameter_name}: {error_code}")
             return None
 
+    def get_parameters(self, parameter_names: List[str]) -> Dict[str, str]:
+        """Get several parameters from SSM Parameter Store in a single request.
+
+        Args:
+            parameter_names (List[str]): The names of the parameters to retrieve
+
+        Returns:
+            Dict[str, str]: Parameter values keyed by name, empty if retrieval fails
+        """
+        names = [name for name in parameter_names if name]
+        if not names:
+            return {}
+
+        try:
+            return get_cached_parameters(names)
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            logger.error(f"Error retrieving parameters {names}: {error_code}")
+            return {}
+
 
 class SecretsManagerService:
     """Class to handle Secrets Manager operations"""
@@ -67,8 +364,10 @@ class SecretsManagerService:
             Optional[str]: Secret token value or None if retrieval fails
         """
         try:
-            response = secrets_client.get_secret_value(SecretId=secret_arn)
-            secret_dict = json.loads(response["SecretString"])
+            response = get_client("secretsmanager").get_secret_value(
+                SecretId=secret_arn
+            )
+            secret_dict = orjson.loads(response["SecretString"])
             return secret_dict.get("token")
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
@@ -82,7 +381,7 @@ class SecretsManagerService:
 class ServiceNowApiService:
     """Class to manage ServiceNow API operations"""
 
-    def __init__(self, instance_id, username, password_param_name):
+    def __init__(self, instance_id, username, password_param_name, password=None):
         """
         Initialize the ServiceNow API service.
 
@@ -90,11 +389,16 @@ class ServiceNowApiService:
             instance_id (str): ServiceNow instance ID
             username (str): ServiceNow username
             password_param_name (str): SSM parameter name containing ServiceNow password
+            password (Optional[str]): ServiceNow password, if already retrieved
         """
         self.instance_id = instance_id
         self.username = username
         self.password_param_name = password_param_name
+        self.base_url = f"https://{instance_id}.service-now.com"
+        self.password = password
         self.secrets_manager_service = SecretsManagerService()
+        self.headers = None
+        self.session = create_session()
 
     def __get_password(self, password_param_name) -> Optional[str]:
         """
@@ -111,10 +415,7 @@ class ServiceNowApiService:
                 logger.error("No ServiceNow password param name provided")
                 return None
 
-            response = ssm_client.get_parameter(
-                Name=password_param_name, WithDecryption=True
-            )
-            return response["Parameter"]["Value"]
+            return get_cached_parameter(password_param_name)
         except Exception as e:
             logger.error(f"Error retrieving ServiceNow password from SSM: {str(e)}")
             return None
@@ -125,51 +426,32 @@ class ServiceNowApiService:
         Returns:
             Optional[Dict[str, str]]: HTTP headers with Basic authentication or None if error
         """
+        if self.headers:
+            return self.headers
+
         try:
-            password = self.__get_password(self.password_param_name)
+            if not self.password:
+                self.password = self.__get_password(self.password_param_name)
+            password = self.password
             auth = b64encode(f"{self.username}:{password}".encode()).decode()
-            return {
+            headers = {
                 "Authorization": f"Basic {auth}",
                 "Content-Type": request_content,
                 "Accept": request_content,
             }
+            # Reuse the headers for later requests once the password was retrieved
+            if password:
+                self.headers = headers
+            return headers
         except Exception as e:
             logger.error(f"Error getting request headers: {str(e)}")
             return None
 
-    def __get_request_base_url(self):
-        """Get base URL for ServiceNow API requests.
-
-        Returns:
-            Optional[str]: ServiceNow instance base URL or None if error
-        """
-        try:
-            return f"https://{self.instance_id}.service-now.com"
-        except Exception as e:
-            logger.error(f"Error getting base url: {str(e)}")
-            return None
-
-    def __get_json_keys_list(self, json_string):
-        """Get list of keys from a JSON string.
-
-        Args:
-            json_string (str): JSON string to parse
-
-        Returns:
-            Optional[List[str]]: List of keys from JSON object or None if error
-        """
-        try:
-            json_object = json.loads(json_string)
-            return list(json_object.keys())
-        except Exception as e:
-            logger.error(f"Error getting json keys list from the request: {str(e)}")
-            return None
-
     def __add_outbound_rest_message_request_function_parameters(
         self,
         headers,
         base_url,
-        request_content,
+        request_content_parameters,
         outbound_rest_message_request_function_sys_id,
     ):
         """Add parameters to HTTP request function for Outbound REST Message resource in ServiceNow.
@@ -177,7 +459,7 @@ class ServiceNowApiService:
         Args:
             headers (Dict[str, str]): HTTP headers for ServiceNow API requests
             base_url (str): ServiceNow instance base URL
-            request_content (str): JSON string containing request parameters
+            request_content_parameters (Tuple[str, ...]): Names of the request parameters
             outbound_rest_message_request_function_sys_id (str): System ID of the REST message function
         """
         try:
@@ -185,37 +467,68 @@ class ServiceNowApiService:
                 "Adding parameters to Http request function for Outbound REST Message resource in ServiceNow for integration with AWS Security Incident Response"
             )
 
-            # Getting parameters from request_content
-            request_content_parameters = self.__get_json_keys_list(request_content)
-
-            if request_content_parameters is None:
-                logger.error(
-                    "Failed to get parameters from request_content while setting up Outbound REST Message in ServiceNow for integration with AWS Security Incident Response. Exiting."
-                )
-                return None
-
             logger.info(
-                f"Parameters to be added to the Http request function: {request_content_parameters}"
+                "Parameters to be added to the Http request function: %s",
+                request_content_parameters,
             )
 
-            # Adding parameters to the Http request function using its sys_id
-            for parameter in request_content_parameters:
-                rest_message_post_function_parameters_payload = {
-                    "name": f"{parameter}",
-                    "rest_message_function": f"{outbound_rest_message_request_function_sys_id}",
-                }
-                requests.post(
-                    f"{base_url}/api/now/table/sys_rest_message_fn_parameters",
-                    json=rest_message_post_function_parameters_payload,
-                    headers=headers,
-                    timeout=30,
-                )
-                logger.info(
-                    f"Added parameter {parameter} to Http request function for Outbound REST Message"
+            # Adding parameters to the Http request function using its sys_id; the
+            # requests are independent, so send them concurrently
+            with ThreadPoolExecutor(
+                max_workers=max(
+                    1, min(SERVICE_NOW_MAX_CONCURRENCY, len(request_content_parameters))
                 )
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        self.__add_outbound_rest_message_request_function_parameter,
+                        headers,
+                        base_url,
+                        parameter,
+                        outbound_rest_message_request_function_sys_id,
+                    ): parameter
+                    for parameter in request_content_parameters
+                }
+                for future in as_completed(futures):
+                    parameter = futures[future]
+                    try:
+                        future.result()
+                        logger.info(
+                            f"Added parameter {parameter} to Http request function for Outbound REST Message"
+                        )
+                    except Exception as e:
+                        logger.error(
+                            f"Error adding parameter {parameter} to Http request function: {str(e)}"
+                        )
         except Exception as e:
             logger.error(f"Error adding parameters to Http request function: {str(e)}")
 
+    def __add_outbound_rest_message_request_function_parameter(
+        self,
+        headers,
+        base_url,
+        parameter,
+        outbound_rest_message_request_function_sys_id,
+    ):
+        """Add a single parameter to HTTP request function for Outbound REST Message resource in ServiceNow.
+
+        Args:
+            headers (Dict[str, str]): HTTP headers for ServiceNow API requests
+            base_url (str): ServiceNow instance base URL
+            parameter (str): Name of the parameter to add
+            outbound_rest_message_request_function_sys_id (str): System ID of the REST message function
+        """
+        rest_message_post_function_parameters_payload = {
+            "name": parameter,
+            "rest_message_function": outbound_rest_message_request_function_sys_id,
+        }
+        self.session.post(
+            f"{base_url}/api/now/table/sys_rest_message_fn_parameters",
+            data=orjson.dumps(rest_message_post_function_parameters_payload),
+            headers=headers,
+            timeout=REQUEST_TIMEOUT,
+        )
+
     def __update_outbound_rest_message_request_function_headers(
         self,
         headers,
@@ -243,27 +556,29 @@ class ServiceNowApiService:
                 else None
             )
 
-            # Update Authorization header if token is available
-            if auth_token:
-                rest_message_post_function_headers_payload = {
-                    "rest_message_function": f"{outbound_rest_message_request_function_name}",
-                    "name": "Authorization",
-                    "value": f"Bearer {auth_token}",
-                }
+            # Update Authorization header only if a token is available
+            if not auth_token:
+                logger.info(
+                    "No API auth token available; skipping Http request Authorization header"
+                )
+                return None
+
+            rest_message_post_function_headers_payload = {
+                "rest_message_function": outbound_rest_message_request_function_name,
+                "name": "Authorization",
+                "value": f"Bearer {auth_token}",
+            }
 
-            rest_message_post_function_headers_response = requests.post(
+            rest_message_post_function_headers_response = self.session.post(
                 f"{base_url}/api/now/table/sys_rest_message_fn_headers",
-                json=rest_message_post_function_headers_payload,
+                data=orjson.dumps(rest_message_post_function_headers_payload),
                 headers=headers,
-                timeout=30,
-            )
-
-            rest_message_post_function_headers_response_json = json.loads(
-                rest_message_post_function_headers_response.text
+                timeout=REQUEST_TIMEOUT,
             )
 
             logger.info(
-                f"Http request authorization headers added for Outbound REST Message function with response: {rest_message_post_function_headers_response_json}"
+                "Http request authorization headers added for Outbound REST Message function with response: %s",
+                rest_message_post_function_headers_response.text,
             )
         except Exception as e:
             logger.error(
@@ -301,31 +616,25 @@ class ServiceNowApiService:
             )
 
             rest_message_post_function_payload = {
-                "rest_message": f"{outbound_rest_message_name}",
-                "function_name": f"{outbound_rest_message_request_function_name}",
-                "http_method": f"{request_type}",
+                "rest_message": outbound_rest_message_name,
+                "function_name": outbound_rest_message_request_function_name,
+                "http_method": request_type,
                 "content": request_content,
             }
 
-            rest_message_post_function_response = requests.post(
+            rest_message_post_function_response = self.session.post(
                 f"{base_url}/api/now/table/sys_rest_message_fn",
-                json=rest_message_post_function_payload,
+                data=orjson.dumps(rest_message_post_function_payload),
                 headers=headers,
-                timeout=30,
+                timeout=REQUEST_TIMEOUT,
             )
-            rest_message_post_function_response_json = json.loads(
-                rest_message_post_function_response.text
+            rest_message_post_function_response_json = orjson.loads(
+                rest_message_post_function_response.content
             )
 
             logger.info(
-                f"Http request function for Outbound REST Message created with response: {rest_message_post_function_response_json}"
-            )
-
-            self.__update_outbound_rest_message_request_function_headers(
-                headers,
-                base_url,
-                outbound_rest_message_request_function_name,
-                api_auth_secret_arn,
+                "Http request function for Outbound REST Message created with response: %s",
+                rest_message_post_function_response_json,
             )
 
             rest_message_post_function_sys_id = (
@@ -358,7 +667,7 @@ class ServiceNowApiService:
             headers = self.__get_request_headers()
 
             # Get base url for ServiceNow API requests
-            base_url = self.__get_request_base_url()
+            base_url = self.base_url
 
             # Create the Outbound REST Message resource
             # Prepare the Outbound REST Message resource name
@@ -366,24 +675,25 @@ class ServiceNowApiService:
 
             # Prepare the Outbound REST Message resource payload
             rest_message_payload = {
-                "name": f"{outbound_rest_message_name}",
-                "rest_endpoint": f"{webhook_url}",
+                "name": outbound_rest_message_name,
+                "rest_endpoint": webhook_url,
             }
 
-            outbound_rest_message_response = requests.post(
+            outbound_rest_message_response = self.session.post(
                 f"{base_url}/api/now/table/sys_rest_message",
-                json=rest_message_payload,
+                data=orjson.dumps(rest_message_payload),
                 headers=headers,
-                timeout=30,
+                timeout=REQUEST_TIMEOUT,
             )
 
             logger.info(
-                f"Outbound REST Message created with response: {json.loads(outbound_rest_message_response.text)}"
+                "Outbound REST Message created with response: %s",
+                outbound_rest_message_response.text,
             )
 
             # Create the Http Post Request function for Outbound REST Message resource
             request_type = "POST"
-            request_content = '{"event_type":"${event_type}","incident_number":"${incident_number}","short_description":"${short_description}"}'
+            request_content = REQUEST_CONTENT_TEMPLATE
             outbound_rest_message_request_function_name = (
                 f"{outbound_rest_message_name}-{request_type}-function"
             )
@@ -404,13 +714,24 @@ class ServiceNowApiService:
                 )
                 return None
 
-            # Add parameters to Http Post Request function for Outbound REST Message resource
-            self.__add_outbound_rest_message_request_function_parameters(
-                headers=headers,
-                base_url=base_url,
-                request_content=request_content,
-                outbound_rest_message_request_function_sys_id=outbound_rest_message_request_function_sys_id,
-            )
+            # The authorization header and the parameters of the Http Post Request
+            # function are independent records, so create them concurrently
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(
+                    self.__update_outbound_rest_message_request_function_headers,
+                    headers,
+                    base_url,
+                    outbound_rest_message_request_function_name,
+                    api_auth_secret_arn,
+                )
+
+                # Add parameters to Http Post Request function for Outbound REST Message resource
+                self.__add_outbound_rest_message_request_function_parameters(
+                    headers=headers,
+                    base_url=base_url,
+                    request_content_parameters=REQUEST_CONTENT_PARAMETERS,
+                    outbound_rest_message_request_function_sys_id=outbound_rest_message_request_function_sys_id,
+                )
 
             return (
                 outbound_rest_message_name,
@@ -447,7 +768,7 @@ class ServiceNowApiService:
             headers = self.__get_request_headers()
 
             # Get base url for ServiceNow API requests
-            base_url = self.__get_request_base_url()
+            base_url = self.base_url
 
             # Business rule for incident events
             rule_payload = {
@@ -457,45 +778,21 @@ class ServiceNowApiService:
                 "action_insert": True,
                 "action_update": True,
                 "active": True,
-                "script": f"""
-        (function executeRule(current, previous) {{
-            try {{
-                var event_type = previous ? 'IncidentUpdated' : 'IncidentCreated';
-                var payload = {{
-                    "event_type": event_type,
-                    "incident_number": current.number.toString(),
-                    "short_description": current.short_description.toString(),
-                }};
-                var outbound_rest_message_name_str = "{outbound_rest_message_name}";
-                var outbound_rest_message_request_function_name_str = "{outbound_rest_message_request_function_name}";
-                var request = new sn_ws.RESTMessageV2(outbound_rest_message_name_str, outbound_rest_message_request_function_name_str);
-                request.setRequestBody(JSON.stringify(payload));
-                
-                var response = request.executeAsync();
-                gs.info('Incident event published to AWS Security Incident Response API Gateway: ' + event_type);
-                var responseBody = response.getBody();
-                var httpStatus = response.getStatusCode();
-                gs.info("Incident Event Response: " + responseBody);
-                gs.info("Incident Event HTTP Status: " + httpStatus);
-                
-            }} catch (error) {{
-                gs.error('Error sending incident event: ' + error.message);
-            }}
-        }})(current, previous);
-        """,
+                "script": INCIDENT_BUSINESS_RULE_SCRIPT_ITSM.substitute(
+                    outbound_rest_message_name=outbound_rest_message_name,
+                    outbound_rest_message_request_function_name=outbound_rest_message_request_function_name,
+                ),
             }
 
             # Create Business Rule resource in Service Now using REST API
-            response = requests.post(
+            response = self.session.post(
                 f"{base_url}/api/now/table/sys_script",
-                json=rule_payload,
+                data=orjson.dumps(rule_payload),
                 headers=headers,
-                timeout=30,
+                timeout=REQUEST_TIMEOUT,
             )
 
-            logger.info(
-                f"ITSM Business Rule created in Service Now: {json.loads(response.text)}"
-            )
+            logger.info("ITSM Business Rule created in Service Now: %s", response.text)
 
             return response
         except Exception as e:
@@ -529,7 +826,7 @@ class ServiceNowApiService:
             headers = self.__get_request_headers()
 
             # Get base url for ServiceNow API requests
-            base_url = self.__get_request_base_url()
+            base_url = self.base_url
 
             # Business rule for security incident events
             rule_payload = {
@@ -539,45 +836,21 @@ class ServiceNowApiService:
                 "action_insert": True,
                 "action_update": True,
                 "active": True,
-                "script": f"""
-        (function executeRule(current, previous) {{
-            try {{
-                var event_type = previous ? 'IncidentUpdated' : 'IncidentCreated';
-                var payload = {{
-                    "event_type": event_type,
-                    "incident_number": current.number.toString(),
-                    "short_description": current.short_description.toString(),
-                }};
-                var outbound_rest_message_name_str = "{outbound_rest_message_name}";
-                var outbound_rest_message_request_function_name_str = "{outbound_rest_message_request_function_name}";
-                var request = new sn_ws.RESTMessageV2(outbound_rest_message_name_str, outbound_rest_message_request_function_name_str);
-                request.setRequestBody(JSON.stringify(payload));
-                
-                var response = request.executeAsync();
-                gs.info('Security Incident event published to AWS Security Incident Response API Gateway: ' + event_type);
-                var responseBody = response.getBody();
-                var httpStatus = response.getStatusCode();
-                gs.info("Security Incident Event Response: " + responseBody);
-                gs.info("Security Incident Event HTTP Status: " + httpStatus);
-                
-            }} catch (error) {{
-                gs.error('Error sending security incident event: ' + error.message);
-            }}
-        }})(current, previous);
-        """,
+                "script": INCIDENT_BUSINESS_RULE_SCRIPT_IR.substitute(
+                    outbound_rest_message_name=outbound_rest_message_name,
+                    outbound_rest_message_request_function_name=outbound_rest_message_request_function_name,
+                ),
             }
 
             # Create Business Rule resource in Service Now using REST API
-            response = requests.post(
+            response = self.session.post(
                 f"{base_url}/api/now/table/sys_script",
-                json=rule_payload,
+                data=orjson.dumps(rule_payload),
                 headers=headers,
-                timeout=30,
+                timeout=REQUEST_TIMEOUT,
             )
 
-            logger.info(
-                f"IR Business Rule created in Service Now: {json.loads(response.text)}"
-            )
+            logger.info("IR Business Rule created in Service Now: %s", response.text)
 
             return response
         except Exception as e:
@@ -611,7 +884,7 @@ class ServiceNowApiService:
             headers = self.__get_request_headers()
 
             # Get base url for ServiceNow API requests
-            base_url = self.__get_request_base_url()
+            base_url = self.base_url
 
             # Business rule for attachment events on incident table
             rule_payload = {
@@ -620,60 +893,22 @@ class ServiceNowApiService:
                 "when": "after",
                 "action_insert": True,
                 "active": True,
-                "script": f"""
-        (function executeRule(current, previous) {{
-            try {{
-                // Only process attachments for incident table
-                gs.info('The current table name is:' + current.table_name);
-                if (current.table_name != 'incident') {{
-                    return;
-                }}
-                
-                var event_type = 'IncidentUpdated';
-                var incident_sys_id = current.table_sys_id.getDisplayValue().toString();
-				gs.info('The incident sys_id: ' + incident_sys_id);
-                
-                // Get incident record to fetch incident number
-                var incident = new GlideRecord('incident');
-                if (incident.get(incident_sys_id)) {{
-                    var payload = {{
-                        "event_type": event_type,
-                        "incident_number": incident.number.toString(),
-                        "short_description": incident.short_description.toString(),
-                    }};
-                    
-                    var outbound_rest_message_name_str = "{outbound_rest_message_name}";
-                    var outbound_rest_message_request_function_name_str = "{outbound_rest_message_request_function_name}";
-                    var request = new sn_ws.RESTMessageV2(outbound_rest_message_name_str, outbound_rest_message_request_function_name_str);
-                    request.setRequestBody(JSON.stringify(payload));
-                    
-                    var response = request.executeAsync();
-                    gs.info('Incident attachment event published to AWS Security Incident Response API Gateway: ' + event_type);
-                    var responseBody = response.getBody();
-                    var httpStatus = response.getStatusCode();
-                    gs.info("Attachment Event Response: " + responseBody);
-                    gs.info("Attachment Event HTTP Status: " + httpStatus);
-                }} else {{
-                    gs.warn('Could not find incident with sys_id: ' + incident_sys_id);
-                }}
-                
-            }} catch (error) {{
-                gs.error('Error sending incident attachment event: ' + error.message);
-            }}
-        }})(current, previous);
-        """,
+                "script": ATTACHMENT_BUSINESS_RULE_SCRIPT_ITSM.substitute(
+                    outbound_rest_message_name=outbound_rest_message_name,
+                    outbound_rest_message_request_function_name=outbound_rest_message_request_function_name,
+                ),
             }
 
             # Create Business Rule resource in Service Now using REST API
-            response = requests.post(
+            response = self.session.post(
                 f"{base_url}/api/now/table/sys_script",
-                json=rule_payload,
+                data=orjson.dumps(rule_payload),
                 headers=headers,
-                timeout=30,
+                timeout=REQUEST_TIMEOUT,
             )
 
             logger.info(
-                f"Attachment Business Rule created in Service Now: {json.loads(response.text)}"
+                "Attachment Business Rule created in Service Now: %s", response.text
             )
 
             return response
@@ -708,7 +943,7 @@ class ServiceNowApiService:
             headers = self.__get_request_headers()
 
             # Get base url for ServiceNow API requests
-            base_url = self.__get_request_base_url()
+            base_url = self.base_url
 
             # Business rule for attachment events on incident table
             rule_payload = {
@@ -717,60 +952,22 @@ class ServiceNowApiService:
                 "when": "after",
                 "action_insert": True,
                 "active": True,
-                "script": f"""
-        (function executeRule(current, previous) {{
-            try {{
-                // Only process attachments for incident table
-                gs.info('The current table name is:' + current.table_name);
-                if (current.table_name != 'sn_si_incident') {{
-                    return;
-                }}
-                
-                var event_type = 'IncidentUpdated';
-                var incident_sys_id = current.table_sys_id.getDisplayValue().toString();
-				gs.info('The incident sys_id: ' + incident_sys_id);
-                
-                // Get incident record to fetch incident number
-                var incident = new GlideRecord('sn_si_incident');
-                if (incident.get(incident_sys_id)) {{
-                    var payload = {{
-                        "event_type": event_type,
-                        "incident_number": incident.number.toString(),
-                        "short_description": incident.short_description.toString(),
-                    }};
-                    
-                    var outbound_rest_message_name_str = "{outbound_rest_message_name}";
-                    var outbound_rest_message_request_function_name_str = "{outbound_rest_message_request_function_name}";
-                    var request = new sn_ws.RESTMessageV2(outbound_rest_message_name_str, outbound_rest_message_request_function_name_str);
-                    request.setRequestBody(JSON.stringify(payload));
-                    
-                    var response = request.executeAsync();
-                    gs.info('Incident attachment event published to AWS Security Incident Response API Gateway: ' + event_type);
-                    var responseBody = response.getBody();
-                    var httpStatus = response.getStatusCode();
-                    gs.info("Attachment Event Response: " + responseBody);
-                    gs.info("Attachment Event HTTP Status: " + httpStatus);
-                }} else {{
-                    gs.warn('Could not find incident with sys_id: ' + incident_sys_id);
-                }}
-                
-            }} catch (error) {{
-                gs.error('Error sending incident attachment event: ' + error.message);
-            }}
-        }})(current, previous);
-        """,
+                "script": ATTACHMENT_BUSINESS_RULE_SCRIPT_IR.substitute(
+                    outbound_rest_message_name=outbound_rest_message_name,
+                    outbound_rest_message_request_function_name=outbound_rest_message_request_function_name,
+                ),
             }
 
             # Create Business Rule resource in Service Now using REST API
-            response = requests.post(
+            response = self.session.post(
                 f"{base_url}/api/now/table/sys_script",
-                json=rule_payload,
+                data=orjson.dumps(rule_payload),
                 headers=headers,
-                timeout=30,
+                timeout=REQUEST_TIMEOUT,
             )
 
             logger.info(
-                f"Attachment Business Rule created in Service Now: {json.loads(response.text)}"
+                "Attachment Business Rule created in Service Now: %s", response.text
             )
 
             return response
@@ -809,16 +1006,22 @@ def handler(event, context):
         webhook_url = os.environ.get("WEBHOOK_URL", "")
         api_auth_secret_arn = os.environ.get("API_AUTH_SECRET")
 
-        # Get credentials from SSM
+        # Get credentials, including the password, from SSM in a single request
         parameter_service = ParameterService()
-        instance_id = parameter_service.get_parameter(
-            os.environ.get("SERVICE_NOW_INSTANCE_ID")
-        )
-        username = parameter_service.get_parameter(os.environ.get("SERVICE_NOW_USER"))
+        instance_id_param = os.environ.get("SERVICE_NOW_INSTANCE_ID")
+        username_param = os.environ.get("SERVICE_NOW_USER")
         password_param_name = os.environ.get("SERVICE_NOW_PASSWORD_PARAM")
+        parameters = parameter_service.get_parameters(
+            [instance_id_param, username_param, password_param_name]
+        )
+        instance_id = parameters.get(instance_id_param)
+        username = parameters.get(username_param)
 
         service_now_api_service = ServiceNowApiService(
-            instance_id, username, password_param_name
+            instance_id,
+            username,
+            password_param_name,
+            parameters.get(password_param_name),
         )
 
         outbound_rest_message_result = (
@@ -841,32 +1044,44 @@ def handler(event, context):
         # Get integration module from environment variable
         integration_module = os.environ.get("INTEGRATION_MODULE", "itsm")
 
-        # Create appropriate business rule based on integration module
+        # Create appropriate business rules based on integration module
         if integration_module == "ir":
-            service_now_api_service._create_incident_business_rule_ir(
-                service_now_api_outbound_rest_message_name,
-                service_now_api_outbound_rest_message_request_function_name,
-                service_now_resource_prefix,
-            )
-            # Create attachment business rule
-            service_now_api_service._create_attachment_business_rule_ir(
-                service_now_api_outbound_rest_message_name,
-                service_now_api_outbound_rest_message_request_function_name,
-                service_now_resource_prefix,
+            business_rule_creators = (
+                service_now_api_service._create_incident_business_rule_ir,
+                service_now_api_service._create_attachment_business_rule_ir,
             )
         else:
-            service_now_api_service._create_incident_business_rule_itsm(
-                service_now_api_outbound_rest_message_name,
-                service_now_api_outbound_rest_message_request_function_name,
-                service_now_resource_prefix,
-            )
-            # Create attachment business rule
-            service_now_api_service._create_attachment_business_rule_itsm(
-                service_now_api_outbound_rest_message_name,
-                service_now_api_outbound_rest_message_request_function_name,
-                service_now_resource_prefix,
+            business_rule_creators = (
+                service_now_api_service._create_incident_business_rule_itsm,
+                service_now_api_service._create_attachment_business_rule_itsm,
             )
 
+        # The incident and attachment business rules only depend on the Outbound REST
+        # Message, so create them concurrently
+        with ThreadPoolExecutor(max_workers=len(business_rule_creators)) as executor:
+            futures = {
+                executor.submit(
+                    create_business_rule,
+                    service_now_api_outbound_rest_message_name,
+                    service_now_api_outbound_rest_message_request_function_name,
+                    service_now_resource_prefix,
+                ): create_business_rule.__name__
+                for create_business_rule in business_rule_creators
+            }
+            failed_business_rule_creators = []
+            for future in as_completed(futures):
+                business_rule_creator = futures[future]
+                # The creators return None on error and leave the HTTP status unchecked
+                response = future.result()
+                if response is None or not response.ok:
+                    logger.error(
+                        f"Failed to create ServiceNow business rule in {business_rule_creator}"
+                    )
+                    failed_business_rule_creators.append(business_rule_creator)
+
+        if failed_business_rule_creators:
+            return {"Status": "FAILED", "PhysicalResourceId": "service-now-api-setup"}
+
         return {"Status": "SUCCESS", "PhysicalResourceId": "service-now-api-setup"}
 
     except Exception as e:
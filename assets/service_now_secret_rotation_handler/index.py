@@ -1,12 +1,16 @@
+import functools
 import json
-from typing import Optional
+import time
+from typing import Dict, List, Optional, Tuple
 import boto3
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import secrets
-import string
 import os
 from base64 import b64encode
 import logging
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # Configure logging
@@ -22,10 +26,109 @@ else:
     # Default to ERROR level
     logger.setLevel(logging.ERROR)
 
-ssm_client = boto3.client("ssm")
-secrets_client = boto3.client("secretsmanager")
+# Client configuration: standard retries, TCP keepalive so warm invocations reuse
+# connections, and tight timeouts instead of the 60s defaults
+BOTO3_CONFIG = Config(
+    retries={"mode": "standard", "max_attempts": 3},
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=5,
+    max_pool_connections=10,
+)
+
+ssm_client = boto3.client("ssm", config=BOTO3_CONFIG)
+secrets_client = boto3.client("secretsmanager", config=BOTO3_CONFIG)
 request_content = "application/json"
 
+# (connect, read) timeouts in seconds for ServiceNow API requests; an unreachable
+# instance fails fast while a slow update still gets the full read timeout
+REQUEST_TIMEOUT = (5, 25)
+
+
+@functools.lru_cache(maxsize=None)
+def create_session():
+    """Get the pooled requests session for ServiceNow API requests, creating it on first use.
+
+    The session is shared across warm invocations. Connection failures and throttled
+    (429) requests, which ServiceNow rejected without processing, are retried with
+    backoff honoring Retry-After; read errors are not, since a POST may already have
+    created its record.
+
+    Returns:
+        requests.Session: Session with a pooled, retrying HTTPS adapter
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                read=0,
+                backoff_factor=0.2,
+                status_forcelist=(429,),
+                allowed_methods=frozenset({"GET", "POST"}),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return session
+
+
+# SSM parameter values cached across warm invocations, keyed by parameter name
+SSM_CACHE_TTL = int(os.environ.get("SSM_CACHE_TTL", "300"))
+parameter_cache: Dict[str, Tuple[float, str]] = {}
+
+
+def get_cached_parameter(parameter_name: str) -> str:
+    """Get a decrypted SSM parameter value, reusing it for SSM_CACHE_TTL seconds.
+
+    Args:
+        parameter_name (str): The name of the parameter to retrieve
+
+    Returns:
+        str: Parameter value
+    """
+    cached = parameter_cache.get(parameter_name)
+    if cached and time.monotonic() - cached[0] < SSM_CACHE_TTL:
+        return cached[1]
+
+    response = ssm_client.get_parameter(Name=parameter_name, WithDecryption=True)
+    value = response["Parameter"]["Value"]
+    parameter_cache[parameter_name] = (time.monotonic(), value)
+    return value
+
+
+def get_cached_parameters(parameter_names: List[str]) -> Dict[str, str]:
+    """Get several decrypted SSM parameter values in a single request, reusing cached ones.
+
+    Args:
+        parameter_names (List[str]): The names of the parameters to retrieve
+
+    Returns:
+        Dict[str, str]: Parameter values keyed by name; names SSM does not know are omitted
+    """
+    now = time.monotonic()
+    values = {}
+    missing = []
+    for name in parameter_names:
+        cached = parameter_cache.get(name)
+        if cached and now - cached[0] < SSM_CACHE_TTL:
+            values[name] = cached[1]
+        else:
+            missing.append(name)
+
+    if missing:
+        response = ssm_client.get_parameters(Names=missing, WithDecryption=True)
+        for parameter in response["Parameters"]:
+            parameter_cache[parameter["Name"]] = (now, parameter["Value"])
+            values[parameter["Name"]] = parameter["Value"]
+        if response["InvalidParameters"]:
+            logger.error(f"Parameters not found: {response['InvalidParameters']}")
+    return values
+
 
 class ParameterService:
     """Class to handle parameter operations"""
@@ -43,15 +146,32 @@ class ParameterService:
             Optional[str]: Parameter value or None if retrieval fails
         """
         try:
-            response = ssm_client.get_parameter(
-                Name=parameter_name, WithDecryption=True
-            )
-            return response["Parameter"]["Value"]
+            return get_cached_parameter(parameter_name)
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
             logger.error(f"Error retrieving parameter {parameter_name}: {error_code}")
             return None
 
+    def get_parameters(self, parameter_names: List[str]) -> Dict[str, str]:
+        """Get several parameters from SSM Parameter Store in a single request.
+
+        Args:
+            parameter_names (List[str]): The names of the parameters to retrieve
+
+        Returns:
+            Dict[str, str]: Parameter values keyed by name, empty if retrieval fails
+        """
+        names = [name for name in parameter_names if name]
+        if not names:
+            return {}
+
+        try:
+            return get_cached_parameters(names)
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            logger.error(f"Error retrieving parameters {names}: {error_code}")
+            return {}
+
 
 class SecretsManagerService:
     """Class to handle Secrets Manager operations"""
@@ -84,7 +204,7 @@ class SecretsManagerService:
 class ServiceNowApiService:
     """Class to manage ServiceNow API operations"""
 
-    def __init__(self, instance_id, username, password_param_name):
+    def __init__(self, instance_id, username, password_param_name, password=None):
         """
         Initialize the ServiceNow API service.
 
@@ -92,11 +212,16 @@ class ServiceNowApiService:
             instance_id (str): ServiceNow instance ID
             username (str): ServiceNow username
             password_param_name (str): SSM parameter name containing ServiceNow password
+            password (Optional[str]): ServiceNow password, if already retrieved
         """
         self.instance_id = instance_id
         self.username = username
         self.password_param_name = password_param_name
+        self.base_url = f"https://{instance_id}.service-now.com"
+        self.password = password
         self.secrets_manager_service = SecretsManagerService()
+        self.headers = None
+        self.session = create_session()
 
     def __get_password(self, password_param_name) -> Optional[str]:
         """
@@ -113,10 +238,7 @@ class ServiceNowApiService:
                 logger.error("No ServiceNow password param name provided")
                 return None
 
-            response = ssm_client.get_parameter(
-                Name=password_param_name, WithDecryption=True
-            )
-            return response["Parameter"]["Value"]
+            return get_cached_parameter(password_param_name)
         except Exception as e:
             logger.error(f"Error retrieving ServiceNow password from SSM: {str(e)}")
             return None
@@ -127,30 +249,27 @@ class ServiceNowApiService:
         Returns:
             Optional[Dict[str, str]]: HTTP headers with Basic authentication or None if error
         """
+        if self.headers:
+            return self.headers
+
         try:
-            password = self.__get_password(self.password_param_name)
+            if not self.password:
+                self.password = self.__get_password(self.password_param_name)
+            password = self.password
             auth = b64encode(f"{self.username}:{password}".encode()).decode()
-            return {
+            headers = {
                 "Authorization": f"Basic {auth}",
                 "Content-Type": request_content,
                 "Accept": request_content,
             }
+            # Reuse the headers for later requests once the password was retrieved
+            if password:
+                self.headers = headers
+            return headers
         except Exception as e:
             logger.error(f"Error getting request headers: {str(e)}")
             return None
 
-    def __get_request_base_url(self):
-        """Get base URL for ServiceNow API requests.
-
-        Returns:
-            Optional[str]: ServiceNow instance base URL or None if error
-        """
-        try:
-            return f"https://{self.instance_id}.service-now.com"
-        except Exception as e:
-            logger.error(f"Error getting base url: {str(e)}")
-            return None
-
     def _update_outbound_rest_message_request_function_headers(
         self,
         resource_prefix,
@@ -174,7 +293,7 @@ class ServiceNowApiService:
             # Get headers for ServiceNow API requests
             headers = self.__get_request_headers()
             # Get base url for ServiceNow API requests
-            base_url = self.__get_request_base_url()
+            base_url = self.base_url
             request_type = "POST"
 
             # Update the Outbound REST Message resource
@@ -192,19 +311,21 @@ class ServiceNowApiService:
                     "value": f"Bearer {api_auth_token}",
                 }
 
-            rest_message_post_function_headers_response = requests.post(
+            rest_message_post_function_headers_response = self.session.post(
                 f"{base_url}/api/now/table/sys_rest_message_fn_headers",
                 json=rest_message_post_function_headers_payload,
                 headers=headers,
-                timeout=30,
+                timeout=REQUEST_TIMEOUT,
             )
+            rest_message_post_function_headers_response.raise_for_status()
 
-            rest_message_post_function_headers_response_json = json.loads(
-                rest_message_post_function_headers_response.text
+            rest_message_post_function_headers_response_json = (
+                rest_message_post_function_headers_response.json()
             )
 
             logger.info(
-                f"Http request function for Outbound REST Message created with response: {rest_message_post_function_headers_response_json}"
+                "Http request authorization headers updated for Outbound REST Message function with response: %s",
+                rest_message_post_function_headers_response_json,
             )
 
             rest_message_post_function_sys_id = (
@@ -218,99 +339,119 @@ class ServiceNowApiService:
             return None
 
 
-def handler(event, context):
+def _create_secret(secret_arn, token):
     """
-    Lambda function to rotate API Gateway authorization token.
-
-    Handles AWS Secrets Manager rotation steps: createSecret, setSecret, testSecret, finishSecret.
-    Updates ServiceNow outbound REST message headers with the new token during createSecret step.
+    Stage a new auth token as AWSPENDING and persist it in ServiceNow.
 
     Args:
-        event (dict): Lambda event containing SecretId, ClientRequestToken, and Step
-        context: Lambda context object (unused)
-
-    Returns:
-        dict: Response with statusCode 200
+        secret_arn (str): ARN of the API auth secret
+        token (str): ClientRequestToken, the version id of the new secret value
     """
-    secret_arn = event["SecretId"]
-    token = event["ClientRequestToken"]
-    step = event["Step"]
-
-    if step == "createSecret":
-        # Generate new token
-        alphabet = string.ascii_letters + string.digits
-        new_token = "".join(secrets.choice(alphabet) for _ in range(32))
-
-        secret_dict = {"token": new_token}
-        secrets_client.put_secret_value(
+    # Generate new token: 24 random bytes as 32 URL-safe base64 characters
+    new_token = secrets.token_urlsafe(24)
+
+    secret_dict = {"token": new_token}
+    secrets_client.put_secret_value(
+        SecretId=secret_arn,
+        ClientRequestToken=token,
+        SecretString=json.dumps(secret_dict),
+        VersionStages=["AWSPENDING"],
+    )
+
+    # Persist the new auth token in ServiceNow
+    # Get environment variables
+    service_now_resource_prefix = os.environ.get("SERVICE_NOW_RESOURCE_PREFIX")
+
+    # Get credentials, including the password, from SSM for ServiceNow in a
+    # single request
+    parameter_service = ParameterService()
+    instance_id_param = os.environ.get("SERVICE_NOW_INSTANCE_ID")
+    username_param = os.environ.get("SERVICE_NOW_USER")
+    service_now_password_param_name = os.environ.get("SERVICE_NOW_PASSWORD_PARAM")
+    parameters = parameter_service.get_parameters(
+        [instance_id_param, username_param, service_now_password_param_name]
+    )
+
+    service_now_api_service = ServiceNowApiService(
+        parameters.get(instance_id_param),
+        parameters.get(username_param),
+        service_now_password_param_name,
+        parameters.get(service_now_password_param_name),
+    )
+
+    try:
+        # The update logs its own errors and returns None rather than raising, so a
+        # failure must be detected here before finishSecret promotes the new token
+        headers_sys_id = service_now_api_service._update_outbound_rest_message_request_function_headers(
+            service_now_resource_prefix, new_token
+        )
+        if headers_sys_id is None:
+            raise Exception("ServiceNow did not accept the new auth token")
+    except Exception as e:
+        logger.error(f"Failed to update ServiceNow headers: {str(e)}")
+        # Clean up the AWSPENDING version if ServiceNow update fails
+        secrets_client.update_secret_version_stage(
             SecretId=secret_arn,
-            ClientRequestToken=token,
-            SecretString=json.dumps(secret_dict),
             VersionStage="AWSPENDING",
+            RemoveFromVersionId=token,
         )
+        raise
 
-        # Persist the new auth token in ServiceNow
-        # Get environment variables
-        service_now_resource_prefix = os.environ.get("SERVICE_NOW_RESOURCE_PREFIX")
 
-        # Get credentials from SSM for ServiceNow
-        parameter_service = ParameterService()
-        service_now_instance_id = parameter_service.get_parameter(
-            os.environ.get("SERVICE_NOW_INSTANCE_ID")
-        )
-        service_now_username = parameter_service.get_parameter(
-            os.environ.get("SERVICE_NOW_USER")
-        )
-        service_now_password_param_name = os.environ.get("SERVICE_NOW_PASSWORD_PARAM")
-
-        service_now_api_service = ServiceNowApiService(
-            service_now_instance_id,
-            service_now_username,
-            service_now_password_param_name,
-        )
-
-        try:
-            service_now_api_service._update_outbound_rest_message_request_function_headers(
-                service_now_resource_prefix, new_token
-            )
-        except Exception as e:
-            logger.error(f"Failed to update ServiceNow headers: {str(e)}")
-            # Clean up the AWSPENDING version if ServiceNow update fails
-            secrets_client.update_secret_version_stage(
-                SecretId=secret_arn,
-                VersionStage="AWSPENDING",
-                ClientRequestToken=token,
-                RemoveFromVersionId=token,
-            )
-            raise
+def _finish_secret(secret_arn, token):
+    """
+    Promote the new auth token version to AWSCURRENT.
 
-        # Move AWSPENDING to AWSCURRENT
+    Args:
+        secret_arn (str): ARN of the API auth secret
+        token (str): ClientRequestToken, the version id of the new secret value
+    """
+    # Move AWSCURRENT from the current version to the new one, unless an earlier
+    # attempt of this step already did
+    version_ids_to_stages = secrets_client.describe_secret(SecretId=secret_arn)[
+        "VersionIdsToStages"
+    ]
+    current_version = next(
+        (
+            version_id
+            for version_id, stages in version_ids_to_stages.items()
+            if "AWSCURRENT" in stages
+        ),
+        None,
+    )
+    if current_version != token:
         secrets_client.update_secret_version_stage(
             SecretId=secret_arn,
             VersionStage="AWSCURRENT",
-            ClientRequestToken=token,
-            RemoveFromVersionId=secrets_client.describe_secret(SecretId=secret_arn)[
-                "VersionIdsToStages"
-            ],
+            MoveToVersionId=token,
+            RemoveFromVersionId=current_version,
         )
 
-    elif step == "setSecret":
-        # No external service to update for this token
-        pass
 
-    elif step == "testSecret":
-        # Test would be done by API Gateway validation
-        pass
+# Rotation steps that need work; setSecret has no external service to update and
+# testSecret is covered by API Gateway validation, so both return immediately
+ROTATION_STEPS = {
+    "createSecret": _create_secret,
+    "finishSecret": _finish_secret,
+}
 
-    elif step == "finishSecret":
-        # This is for validation and adds an extra layer of error handling i.e. move AWSPENDING to AWSCURRENT if not already at the "createSecret" step.
-        secrets_client.update_secret_version_stage(
-            SecretId=secret_arn,
-            VersionStage="AWSCURRENT",
-            ClientRequestToken=token,
-            RemoveFromVersionId=secrets_client.describe_secret(SecretId=secret_arn)[
-                "VersionIdsToStages"
-            ],
-        )
+
+def handler(event, context):
+    """
+    Lambda function to rotate API Gateway authorization token.
+
+    Handles AWS Secrets Manager rotation steps: createSecret, setSecret, testSecret, finishSecret.
+    Updates ServiceNow outbound REST message headers with the new token during createSecret step.
+
+    Args:
+        event (dict): Lambda event containing SecretId, ClientRequestToken, and Step
+        context: Lambda context object (unused)
+
+    Returns:
+        dict: Response with statusCode 200
+    """
+    rotation_step = ROTATION_STEPS.get(event["Step"])
+    if rotation_step:
+        rotation_step(event["SecretId"], event["ClientRequestToken"])
 
     return {"statusCode": 200}
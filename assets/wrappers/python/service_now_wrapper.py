@@ -23,6 +23,39 @@ ssm_client = boto3.client("ssm")
 class ServiceNowClient:
     """Class to handle ServiceNow API interactions"""
 
+    # Incident fields copied by extract_incident_details, in output order
+    _INCIDENT_DETAIL_FIELDS = (
+        "sys_id",
+        "number",
+        "short_description",
+        "description",
+        "sys_created_on",
+        "sys_created_by",
+        "resolved_by",
+        "resolved_at",
+        "opened_at",
+        "closed_at",
+        "state",
+        "impact",
+        "active",
+        "priority",
+        "caller_id",
+        "urgency",
+        "severity",
+        "comments",
+        "work_notes",
+        "comments_and_work_notes",
+        "close_code",
+        "close_notes",
+        "closed_by",
+        "reopened_by",
+        "assigned_to",
+        "due_date",
+        "sys_tags",
+        "category",
+        "subcategory",
+    )
+
     def __init__(self, instance_id, username, password_param_name):
         """
         Initialize the ServiceNow client.
@@ -164,7 +197,10 @@ class ServiceNowClient:
             glide_record.query()
             if glide_record.next():
                 logger.info(
-                    f"Incident details for {incident_number} from ServiceNow {table_name}: {glide_record}"
+                    "Incident details for %s from ServiceNow %s: %s",
+                    incident_number,
+                    table_name,
+                    glide_record,
                 )
                 logger.info(
                     f"Getting DisplayValue for the Incident {incident_number} GlideRecord from ServiceNow"
@@ -173,7 +209,10 @@ class ServiceNowClient:
                     display_value=True
                 )
                 logger.info(
-                    f"Display values for incident details for {incident_number} from ServiceNow {table_name}: {glide_record_with_display_values}"
+                    "Display values for incident details for %s from ServiceNow %s: %s",
+                    incident_number,
+                    table_name,
+                    glide_record_with_display_values,
                 )
                 return glide_record_with_display_values
         except Exception as e:
@@ -208,7 +247,10 @@ class ServiceNowClient:
             glide_record.query()
             if glide_record.next():
                 logger.info(
-                    f"Incident details for {incident_number} from ServiceNow {table_name}: {glide_record}"
+                    "Incident details for %s from ServiceNow %s: %s",
+                    incident_number,
+                    table_name,
+                    glide_record,
                 )
                 return glide_record
         except Exception as e:
@@ -250,7 +292,9 @@ class ServiceNowClient:
                         "content_type": attachment.content_type,
                     }
                     logger.info(
-                        f"Incident attachment details for incident {glide_record.number}: {attachment_details}"
+                        "Incident attachment details for incident %s: %s",
+                        glide_record.number,
+                        attachment_details,
                     )
                     attachments_list.append(attachment_details)
                 return attachments_list
@@ -535,39 +579,10 @@ class ServiceNowClient:
         """
         try:
             incident_dict = {
-                "sys_id": service_now_incident.get("sys_id"),
-                "number": service_now_incident.get("number"),
-                "short_description": service_now_incident.get("short_description"),
-                "description": service_now_incident.get("description"),
-                "sys_created_on": service_now_incident.get("sys_created_on"),
-                "sys_created_by": service_now_incident.get("sys_created_by"),
-                "resolved_by": service_now_incident.get("resolved_by"),
-                "resolved_at": service_now_incident.get("resolved_at"),
-                "opened_at": service_now_incident.get("opened_at"),
-                "closed_at": service_now_incident.get("closed_at"),
-                "state": service_now_incident.get("state"),
-                "impact": service_now_incident.get("impact"),
-                "active": service_now_incident.get("active"),
-                "priority": service_now_incident.get("priority"),
-                "caller_id": service_now_incident.get("caller_id"),
-                "urgency": service_now_incident.get("urgency"),
-                "severity": service_now_incident.get("severity"),
-                "comments": service_now_incident.get("comments"),
-                "work_notes": service_now_incident.get("work_notes"),
-                "comments_and_work_notes": service_now_incident.get(
-                    "comments_and_work_notes"
-                ),
-                "close_code": service_now_incident.get("close_code"),
-                "close_notes": service_now_incident.get("close_notes"),
-                "closed_by": service_now_incident.get("closed_by"),
-                "reopened_by": service_now_incident.get("reopened_by"),
-                "assigned_to": service_now_incident.get("assigned_to"),
-                "due_date": service_now_incident.get("due_date"),
-                "sys_tags": service_now_incident.get("sys_tags"),
-                "category": service_now_incident.get("category"),
-                "subcategory": service_now_incident.get("subcategory"),
-                "attachments": service_now_incident_attachments,
+                field: service_now_incident.get(field)
+                for field in self._INCIDENT_DETAIL_FIELDS
             }
+            incident_dict["attachments"] = service_now_incident_attachments
             return incident_dict
         except Exception as e:
             logger.error(f"Error extracting ServiceNow incident details: {str(e)}")
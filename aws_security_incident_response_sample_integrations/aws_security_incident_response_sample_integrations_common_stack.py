@@ -83,6 +83,14 @@ class AwsSecurityIncidentResponseSampleIntegrationsCommonStack(Stack):
             point_in_time_recovery=True,
         )
 
+        # Index for looking up records by ServiceNow incident number without a table scan
+        self.table.add_global_secondary_index(
+            index_name="serviceNowIncidentId-index",
+            partition_key=dynamodb.Attribute(
+                name="serviceNowIncidentId", type=dynamodb.AttributeType.STRING
+            ),
+        )
+
         """
         cdk for event_bus
         """
@@ -333,6 +333,7 @@ class AwsSecurityIncidentResponseServiceNowIntegrationStack(Stack):
             aws_iam.PolicyStatement(
                 effect=aws_iam.Effect.ALLOW,
                 actions=[
+                    "secretsmanager:DescribeSecret",
                     "secretsmanager:GetSecretValue",
                     "secretsmanager:PutSecretValue",
                     "secretsmanager:UpdateSecretVersionStage",
@@ -341,6 +342,15 @@ class AwsSecurityIncidentResponseServiceNowIntegrationStack(Stack):
             )
         )
 
+        # Allow reading the ServiceNow credentials from SSM
+        service_now_secret_rotation_handler_role.add_to_policy(
+            aws_iam.PolicyStatement(
+                effect=aws_iam.Effect.ALLOW,
+                actions=["ssm:GetParameter", "ssm:GetParameters"],
+                resources=["*"],
+            )
+        )
+
         # Create rotation Lambda function
         service_now_secret_rotation_handler = py_lambda.PythonFunction(
             self,
@@ -352,6 +362,13 @@ class AwsSecurityIncidentResponseServiceNowIntegrationStack(Stack):
             ),
             runtime=aws_lambda.Runtime.PYTHON_3_13,
             timeout=Duration.minutes(5),
+            environment={
+                "SERVICE_NOW_INSTANCE_ID": service_now_instance_id_ssm.parameter_name,
+                "SERVICE_NOW_USER": service_now_user_ssm.parameter_name,
+                "SERVICE_NOW_PASSWORD_PARAM": service_now_password_ssm_param.parameter_name,
+                "SERVICE_NOW_RESOURCE_PREFIX": service_now_api_gateway.rest_api_id,
+                "LOG_LEVEL": log_level_param.value_as_string,
+            },
             role=service_now_secret_rotation_handler_role,
         )
 
@@ -382,7 +399,7 @@ class AwsSecurityIncidentResponseServiceNowIntegrationStack(Stack):
             [
                 {
                     "id": "AwsSolutions-IAM5",
-                    "reason": "Wildcard resources are required for Secrets Manager rotation",
+                    "reason": "Wildcard resources are required for Secrets Manager rotation and SSM parameters",
                     "applies_to": ["Resource::*"],
                 }
             ],
@@ -428,7 +445,7 @@ class AwsSecurityIncidentResponseServiceNowIntegrationStack(Stack):
         service_now_notifications_handler_role.add_to_policy(
             aws_iam.PolicyStatement(
                 effect=aws_iam.Effect.ALLOW,
-                actions=["ssm:GetParameter"],
+                actions=["ssm:GetParameter", "ssm:GetParameters"],
                 resources=["*"],
             )
         )
@@ -468,6 +485,22 @@ class AwsSecurityIncidentResponseServiceNowIntegrationStack(Stack):
             role=service_now_notifications_handler_role,
         )
 
+        # Optionally keep pre-initialized execution environments for the webhook handler
+        # (cdk deploy -c serviceNowNotificationsProvisionedConcurrency=<count>)
+        service_now_notifications_provisioned_concurrency = int(
+            self.node.try_get_context("serviceNowNotificationsProvisionedConcurrency")
+            or 0
+        )
+        service_now_notifications_handler_target = service_now_notifications_handler
+        if service_now_notifications_provisioned_concurrency > 0:
+            service_now_notifications_handler_target = aws_lambda.Alias(
+                self,
+                "ServiceNowNotificationsHandlerLiveAlias",
+                alias_name="live",
+                version=service_now_notifications_handler.current_version,
+                provisioned_concurrent_executions=service_now_notifications_provisioned_concurrency,
+            )
+
         # Add a specific rule for ServiceNow notification events
         service_now_notifications_rule = aws_events.Rule(
             self,
@@ -547,7 +580,7 @@ class AwsSecurityIncidentResponseServiceNowIntegrationStack(Stack):
         # Create webhook resource and methods
         webhook_resource = service_now_api_gateway.root.add_resource("webhook")
         webhook_integration = aws_apigateway.LambdaIntegration(
-            service_now_notifications_handler
+            service_now_notifications_handler_target
         )
 
         webhook_resource.add_method(
@@ -558,7 +591,7 @@ class AwsSecurityIncidentResponseServiceNowIntegrationStack(Stack):
         # OPTIONS method is automatically added by CORS configuration, no need to add it manually
 
         # Grant API Gateway permission to invoke the Lambda function
-        service_now_notifications_handler.grant_invoke(
+        service_now_notifications_handler_target.grant_invoke(
             aws_iam.ServicePrincipal("apigateway.amazonaws.com")
         )
 
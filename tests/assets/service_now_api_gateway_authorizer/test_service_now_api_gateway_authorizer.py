@@ -0,0 +1,96 @@
+import json
+import pytest
+from unittest.mock import MagicMock
+
+SECRET_ARN = "arn:aws:secretsmanager:us-east-1:123456789012:secret:api-auth"
+METHOD_ARN = "arn:aws:execute-api:us-east-1:123456789012:api-id/prod/POST/webhook"
+
+
+def _secret(token):
+    return {"SecretString": json.dumps({"token": token})}
+
+
+@pytest.fixture
+def clock(mocker):
+    # Controllable clock for cache expiry
+    return mocker.patch("time.monotonic", return_value=1000.0)
+
+
+@pytest.fixture
+def authorizer(monkeypatch, mocker, clock):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("API_AUTH_SECRET", SECRET_ARN)
+
+    from assets.service_now_api_gateway_authorizer import index
+
+    mock_secrets = MagicMock()
+    mock_secrets.get_secret_value.return_value = _secret("current-token")
+    mocker.patch.object(index, "secrets_client", mock_secrets)
+    mocker.patch.object(index, "token_cache", {})
+    return index
+
+
+def _effect(index, token):
+    policy = index.handler(
+        {"authorizationToken": f"Bearer {token}", "methodArn": METHOD_ARN}, None
+    )
+    return policy["policyDocument"]["Statement"][0]["Effect"]
+
+
+def test_get_expected_token_cache_hit(authorizer):
+    """Test the expected token is reused from the cache"""
+    assert authorizer.get_expected_token(SECRET_ARN) == (b"current-token", False)
+    assert authorizer.get_expected_token(SECRET_ARN) == (b"current-token", True)
+
+    authorizer.secrets_client.get_secret_value.assert_called_once_with(
+        SecretId=SECRET_ARN
+    )
+
+
+def test_get_expected_token_expires(authorizer, clock):
+    """Test the expected token is refetched once SECRET_CACHE_TTL has passed"""
+    authorizer.get_expected_token(SECRET_ARN)
+    clock.return_value += authorizer.SECRET_CACHE_TTL
+
+    assert authorizer.get_expected_token(SECRET_ARN) == (b"current-token", False)
+    assert authorizer.secrets_client.get_secret_value.call_count == 2
+
+
+def test_valid_token_allowed(authorizer):
+    """Test a matching token is allowed and cached"""
+    assert _effect(authorizer, "current-token") == "Allow"
+    assert _effect(authorizer, "current-token") == "Allow"
+
+    authorizer.secrets_client.get_secret_value.assert_called_once()
+
+
+def test_rotated_token_accepted_after_refetch(authorizer, clock):
+    """Test a rotated token is accepted once the cached token is refetched"""
+    assert _effect(authorizer, "current-token") == "Allow"
+
+    authorizer.secrets_client.get_secret_value.return_value = _secret("rotated-token")
+    clock.return_value += authorizer.SECRET_REFETCH_INTERVAL
+
+    assert _effect(authorizer, "rotated-token") == "Allow"
+    assert _effect(authorizer, "current-token") == "Deny"
+
+
+def test_invalid_token_denied(authorizer, clock):
+    """Test a wrong token is denied and refetches at most once per interval"""
+    assert _effect(authorizer, "current-token") == "Allow"
+
+    for _ in range(5):
+        assert _effect(authorizer, "wrong-token") == "Deny"
+    authorizer.secrets_client.get_secret_value.assert_called_once()
+
+    clock.return_value += authorizer.SECRET_REFETCH_INTERVAL
+    assert _effect(authorizer, "wrong-token") == "Deny"
+    assert authorizer.secrets_client.get_secret_value.call_count == 2
+
+
+@pytest.mark.parametrize("token", ["", "x" * 257])
+def test_malformed_token_denied_without_secret_lookup(authorizer, token):
+    """Test empty or oversized tokens are denied without reading the secret"""
+    assert _effect(authorizer, token) == "Deny"
+
+    authorizer.secrets_client.get_secret_value.assert_not_called()
@@ -0,0 +1,288 @@
+import json
+import os
+import subprocess
+import sys
+import boto3
+import pytest
+from moto import mock_aws
+
+TABLE_NAME = "test-incidents-table"
+
+
+@pytest.fixture
+def aws_environment(monkeypatch):
+    # Fake credentials and region so no real AWS account is ever reached
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+
+
+@pytest.fixture
+def incidents_table(aws_environment):
+    with mock_aws():
+        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        table = dynamodb.create_table(
+            TableName=TABLE_NAME,
+            KeySchema=[
+                {"AttributeName": "PK", "KeyType": "HASH"},
+                {"AttributeName": "SK", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"},
+                {"AttributeName": "serviceNowIncidentId", "AttributeType": "S"},
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": "serviceNowIncidentId-index",
+                    "KeySchema": [
+                        {"AttributeName": "serviceNowIncidentId", "KeyType": "HASH"}
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                }
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield table
+
+
+@pytest.fixture
+def db_service(incidents_table, mocker):
+    from assets.service_now_notifications_handler.index import DatabaseService
+
+    # Lookups retry with backoff while the record is missing; don't wait in tests
+    mocker.patch("assets.service_now_notifications_handler.index.time.sleep")
+
+    service = DatabaseService(TABLE_NAME)
+    service.table = incidents_table
+    return service
+
+
+@pytest.fixture
+def processor(db_service, mocker):
+    from assets.service_now_notifications_handler.index import (
+        ServiceNowMessageProcessorService,
+    )
+
+    mocker.patch("assets.service_now_notifications_handler.index.ServiceNowService")
+    processor = ServiceNowMessageProcessorService(
+        "instance", "user", "/password", TABLE_NAME, "default"
+    )
+    processor.db_service = db_service
+    processor.event_publisher_service = mocker.MagicMock()
+    return processor
+
+
+def test_update_incident_details_if_changed_new_incident(db_service):
+    """Test conditional update of an incident with no stored record"""
+    result = db_service._update_incident_details_if_changed(
+        "INC0010001", {"state": "New"}
+    )
+
+    assert result is None
+    assert "Item" not in db_service.table.get_item(
+        Key={"PK": "ServiceNow#INC0010001", "SK": "latest"}
+    )
+
+
+def test_update_incident_details_if_changed_unchanged(processor):
+    """Test an unchanged incident is not published"""
+    from assets.service_now_notifications_handler.index import DatabaseService
+
+    processor.db_service._add_incident_details("INC0010001", {"state": "New"})
+    processor.service_now_service._get_incident_details.return_value = {"state": "New"}
+
+    # Use a fresh service so the result comes from DynamoDB, not the cache
+    table = processor.db_service.table
+    processor.db_service = DatabaseService(TABLE_NAME)
+    processor.db_service.table = table
+
+    assert (
+        processor.db_service._update_incident_details_if_changed(
+            "INC0010001", {"state": "New"}
+        )
+        is False
+    )
+    assert processor._process_webhook_payload({"incident_number": "INC0010001"})
+    processor.event_publisher_service._publish_event.assert_not_called()
+
+
+def test_update_incident_details_if_changed_changed(db_service):
+    """Test conditional update of an incident whose details have changed"""
+    from assets.service_now_notifications_handler.index import _details_hash
+
+    db_service._add_incident_details("INC0010001", {"state": "New"})
+
+    result = db_service._update_incident_details_if_changed(
+        "INC0010001", {"state": "In Progress"}
+    )
+
+    item = db_service.table.get_item(
+        Key={"PK": "ServiceNow#INC0010001", "SK": "latest"}
+    )["Item"]
+    assert result is True
+    assert item["serviceNowIncidentDetails"] == {"state": "In Progress"}
+    assert item["detailsHash"] == _details_hash({"state": "In Progress"})
+
+
+def test_update_incident_details_if_changed_backfills_hash(db_service):
+    """Test conditional update of a record written before detailsHash existed"""
+    from assets.service_now_notifications_handler.index import _details_hash
+
+    details = {"state": "New"}
+    db_service.table.put_item(
+        Item={
+            "PK": "ServiceNow#INC0010001",
+            "SK": "latest",
+            "serviceNowIncidentId": "INC0010001",
+            "serviceNowIncidentDetails": '{"state": "New"}',
+        }
+    )
+
+    result = db_service._update_incident_details_if_changed("INC0010001", details)
+
+    item = db_service.table.get_item(
+        Key={"PK": "ServiceNow#INC0010001", "SK": "latest"}
+    )["Item"]
+    assert result is False
+    assert item["serviceNowIncidentDetails"] == details
+    assert item["detailsHash"] == _details_hash(details)
+
+
+def test_update_incident_details_if_changed_across_instances(db_service):
+    """Test two instances sharing the table cannot lose an update"""
+    from assets.service_now_notifications_handler.index import DatabaseService
+
+    other_service = DatabaseService(TABLE_NAME)
+    other_service.table = db_service.table
+
+    db_service._add_incident_details("INC0010001", {"state": "New"})
+    assert other_service._update_incident_details_if_changed(
+        "INC0010001", {"state": "In Progress"}
+    )
+
+    # Reverting to details this instance stored earlier is still a change
+    assert db_service._update_incident_details_if_changed(
+        "INC0010001", {"state": "New"}
+    )
+    item = db_service.table.get_item(
+        Key={"PK": "ServiceNow#INC0010001", "SK": "latest"}
+    )["Item"]
+    assert item["serviceNowIncidentDetails"] == {"state": "New"}
+
+
+@pytest.fixture
+def event_publisher(aws_environment, mocker):
+    from assets.service_now_notifications_handler.index import EventPublisherService
+
+    publisher = EventPublisherService("test-event-bus")
+    publisher.events_client = mocker.MagicMock()
+    return publisher
+
+
+@pytest.fixture
+def sleep(mocker):
+    # Failed entries are resent after a backoff; don't wait in tests
+    return mocker.patch("assets.service_now_notifications_handler.index.time.sleep")
+
+
+def _updated_events(count):
+    from assets.service_now_notifications_handler.index import IncidentUpdatedEvent
+
+    return [IncidentUpdatedEvent({"number": f"INC{i:07d}"}) for i in range(count)]
+
+
+def _sent_numbers(call):
+    return [json.loads(entry["Detail"])["number"] for entry in call.kwargs["Entries"]]
+
+
+def test_publish_events_batches_entries(event_publisher):
+    """Test publishing more events than fit in a single PutEvents call"""
+    event_publisher.events_client.put_events.return_value = {
+        "FailedEntryCount": 0,
+        "Entries": [],
+    }
+
+    responses = event_publisher._publish_events(_updated_events(12))
+
+    calls = event_publisher.events_client.put_events.call_args_list
+    assert len(responses) == 2
+    assert [len(call.kwargs["Entries"]) for call in calls] == [10, 2]
+
+
+def test_publish_events_resends_only_failed_entries(event_publisher, sleep):
+    """Test only the entries that failed are resent"""
+    event_publisher.events_client.put_events.side_effect = [
+        {
+            "FailedEntryCount": 2,
+            "Entries": [
+                {"EventId": "1"},
+                {"ErrorCode": "ThrottlingException", "ErrorMessage": "Rate exceeded"},
+                {"EventId": "3"},
+                {"ErrorCode": "InternalFailure", "ErrorMessage": "Internal error"},
+            ],
+        },
+        {"FailedEntryCount": 0, "Entries": [{"EventId": "2"}, {"EventId": "4"}]},
+    ]
+
+    event_publisher._publish_events(_updated_events(4))
+
+    calls = event_publisher.events_client.put_events.call_args_list
+    assert len(calls) == 2
+    assert _sent_numbers(calls[0]) == [f"INC{i:07d}" for i in range(4)]
+    assert _sent_numbers(calls[1]) == ["INC0000001", "INC0000003"]
+
+
+def test_publish_events_raises_after_max_attempts(event_publisher, sleep):
+    """Test entries that keep failing raise once the attempts run out"""
+    event_publisher.events_client.put_events.return_value = {
+        "FailedEntryCount": 1,
+        "Entries": [
+            {"ErrorCode": "ThrottlingException", "ErrorMessage": "Rate exceeded"}
+        ],
+    }
+
+    with pytest.raises(Exception):
+        event_publisher._publish_events(_updated_events(1))
+
+    assert event_publisher.events_client.put_events.call_count == 3
+    assert sleep.call_count == 2
+
+
+def test_failed_publish_is_retried_by_next_webhook(processor):
+    """Test an update whose event failed to publish is published again later"""
+    processor.db_service._add_incident_details("INC0010001", {"state": "New"})
+    processor.service_now_service._get_incident_details.return_value = {
+        "state": "In Progress"
+    }
+    publish = processor.event_publisher_service._publish_event
+    publish.side_effect = Exception("Failed to publish 1 event(s) after 3 attempts")
+
+    assert not processor._process_webhook_payload({"incident_number": "INC0010001"})
+
+    publish.side_effect = None
+    publish.reset_mock()
+    assert processor._process_webhook_payload({"incident_number": "INC0010001"})
+    publish.assert_called_once()
+
+
+@pytest.mark.parametrize("log_level, expected", [("error", 40), ("info", 20)])
+def test_root_logger_follows_log_level(aws_environment, log_level, expected):
+    """Test LOG_LEVEL overrides the root level set by the ServiceNow wrapper"""
+    # Import in a fresh interpreter so module-level logging setup runs again
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import logging, assets.service_now_notifications_handler.index; "
+            "print(logging.getLogger().level)",
+        ],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "LOG_LEVEL": log_level},
+        check=True,
+    )
+
+    assert int(result.stdout.strip().splitlines()[-1]) == expected
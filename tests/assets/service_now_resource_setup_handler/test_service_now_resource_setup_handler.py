@@ -0,0 +1,69 @@
+import pytest
+from unittest.mock import MagicMock
+
+
+@pytest.fixture
+def setup_handler(monkeypatch, mocker):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("SERVICE_NOW_RESOURCE_PREFIX", "test-prefix")
+    monkeypatch.setenv("SERVICE_NOW_INSTANCE_ID", "/instance-id")
+    monkeypatch.setenv("SERVICE_NOW_USER", "/user")
+    monkeypatch.setenv("SERVICE_NOW_PASSWORD_PARAM", "/password")
+    monkeypatch.setenv("INTEGRATION_MODULE", "itsm")
+
+    from assets.service_now_resource_setup_handler import index
+
+    mocker.patch.object(
+        index.ParameterService,
+        "get_parameters",
+        return_value={
+            "/instance-id": "test-instance",
+            "/user": "admin",
+            "/password": "secret",
+        },
+    )
+    mocker.patch.object(
+        index.ServiceNowApiService,
+        "_create_outbound_rest_message",
+        return_value=("rest-message", "rest-message-function"),
+    )
+    return index
+
+
+def _response(ok):
+    response = MagicMock()
+    response.ok = ok
+    return response
+
+
+@pytest.mark.parametrize(
+    "attachment_rule_result, expected_status",
+    [
+        (_response(True), "SUCCESS"),
+        (_response(False), "FAILED"),
+        (None, "FAILED"),
+    ],
+)
+def test_handler_business_rule_results(
+    setup_handler, mocker, attachment_rule_result, expected_status
+):
+    """Test business rules that fail or return an HTTP error fail the resource"""
+    mocker.patch.object(
+        setup_handler.ServiceNowApiService,
+        "_create_incident_business_rule_itsm",
+        return_value=_response(True),
+        autospec=True,
+    )
+    mocker.patch.object(
+        setup_handler.ServiceNowApiService,
+        "_create_attachment_business_rule_itsm",
+        return_value=attachment_rule_result,
+        autospec=True,
+    )
+
+    result = setup_handler.handler({"RequestType": "Create"}, None)
+
+    assert result == {
+        "Status": expected_status,
+        "PhysicalResourceId": "service-now-api-setup",
+    }
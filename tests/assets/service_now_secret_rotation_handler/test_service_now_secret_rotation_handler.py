@@ -0,0 +1,107 @@
+import boto3
+import pytest
+import requests
+from unittest.mock import MagicMock
+from moto import mock_aws
+
+
+@pytest.fixture
+def aws_environment(monkeypatch):
+    # Fake credentials and region so no real AWS account is ever reached
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+
+
+@pytest.fixture
+def secrets_client(aws_environment, mocker):
+    with mock_aws():
+        from assets.service_now_secret_rotation_handler import index
+
+        client = boto3.client("secretsmanager", region_name="us-east-1")
+        mocker.patch.object(index, "secrets_client", client)
+        yield client
+
+
+def _stages(client, secret_arn):
+    return client.describe_secret(SecretId=secret_arn)["VersionIdsToStages"]
+
+
+def test_finish_secret_promotes_pending_version(secrets_client, mocker):
+    """Test finishSecret moves AWSCURRENT to the pending version"""
+    from assets.service_now_secret_rotation_handler.index import _finish_secret
+
+    secret_arn = secrets_client.create_secret(
+        Name="api-auth-token", SecretString='{"token": "old-token"}'
+    )["ARN"]
+    (old_version,) = _stages(secrets_client, secret_arn)
+    new_version = "11111111-1111-1111-1111-111111111111"
+    secrets_client.put_secret_value(
+        SecretId=secret_arn,
+        ClientRequestToken=new_version,
+        SecretString='{"token": "new-token"}',
+        VersionStages=["AWSPENDING"],
+    )
+    update_stage = mocker.spy(secrets_client, "update_secret_version_stage")
+
+    _finish_secret(secret_arn, new_version)
+
+    update_stage.assert_called_once_with(
+        SecretId=secret_arn,
+        VersionStage="AWSCURRENT",
+        MoveToVersionId=new_version,
+        RemoveFromVersionId=old_version,
+    )
+    stages = _stages(secrets_client, secret_arn)
+    assert "AWSCURRENT" in stages[new_version]
+    assert "AWSCURRENT" not in stages[old_version]
+    assert "AWSPREVIOUS" in stages[old_version]
+
+    # Retried step: the new version is already current, so nothing changes
+    update_stage.reset_mock()
+    _finish_secret(secret_arn, new_version)
+
+    update_stage.assert_not_called()
+    assert _stages(secrets_client, secret_arn) == stages
+
+
+def test_create_secret_service_now_failure(secrets_client, monkeypatch, mocker):
+    """Test createSecret drops AWSPENDING when ServiceNow rejects the new token"""
+    from assets.service_now_secret_rotation_handler import index
+
+    monkeypatch.setenv("SERVICE_NOW_RESOURCE_PREFIX", "test-prefix")
+    monkeypatch.setenv("SERVICE_NOW_INSTANCE_ID", "/instance-id")
+    monkeypatch.setenv("SERVICE_NOW_USER", "/user")
+    monkeypatch.setenv("SERVICE_NOW_PASSWORD_PARAM", "/password")
+    mocker.patch.object(
+        index.ParameterService,
+        "get_parameters",
+        return_value={
+            "/instance-id": "test-instance",
+            "/user": "admin",
+            "/password": "wrong-password",
+        },
+    )
+    response = MagicMock()
+    response.raise_for_status.side_effect = requests.HTTPError(
+        "401 Client Error: Unauthorized"
+    )
+    session = MagicMock()
+    session.post.return_value = response
+    mocker.patch.object(index, "create_session", return_value=session)
+
+    secret_arn = secrets_client.create_secret(
+        Name="api-auth-token", SecretString='{"token": "old-token"}'
+    )["ARN"]
+    (old_version,) = _stages(secrets_client, secret_arn)
+    new_version = "11111111-1111-1111-1111-111111111111"
+
+    with pytest.raises(Exception):
+        index._create_secret(secret_arn, new_version)
+
+    session.post.assert_called_once()
+    stages = _stages(secrets_client, secret_arn)
+    assert "AWSPENDING" not in stages.get(new_version, [])
+    assert "AWSCURRENT" in stages[old_version]